@@ -0,0 +1,47 @@
+'''
+Validation time with and without code generated for the rules, see Schema.generated()
+
+python benchmarks/codegen.py
+'''
+import timeit
+from pyva import Schema
+
+flat_data = {}
+flat_rules = {}
+for i in range(50):
+    name = 'field{}'.format(i)
+    if i % 3 == 0:
+        flat_data[name], flat_rules[name] = 'value {}'.format(i), 'required|string|max:32'
+    elif i % 3 == 1:
+        flat_data[name], flat_rules[name] = i, 'required|integer|between:0,100'
+    else:
+        flat_data[name], flat_rules[name] = 'user{}@example.com'.format(i), 'required|email'
+
+list_data = {
+    'users': [
+        {'name': 'user {}'.format(i), 'role': 'admin' if i % 2 else 'user', 'ip': '10.0.0.{}'.format(i % 256)}
+        for i in range(1000)
+    ]
+}
+list_rules = {
+    'users': 'required|list',
+    'users.*.name': 'required|string|min:3|max:32',
+    'users.*.role': 'required|in:admin,user',
+    'users.*.ip': 'nullable|ipv4',
+}
+
+cases = [
+    ('flat 50 fields', flat_data, flat_rules, 2000),
+    ('list of 1000 users', list_data, list_rules, 50),
+]
+
+for name, data, rules, number in cases:
+    schema = Schema(rules)
+    generated = schema.generated()
+
+    interpreted_time = min(timeit.repeat(lambda: schema.validate(data), number=number, repeat=3))
+    generated_time = min(timeit.repeat(lambda: generated.validate(data), number=number, repeat=3))
+
+    print('{:<20} {:>9.1f} us, generated {:>9.1f} us, {:.2f}x'.format(
+        name, interpreted_time / number * 1e6, generated_time / number * 1e6, interpreted_time / generated_time
+    ))
@@ -0,0 +1,29 @@
+'''
+Dependent rules on every item of a big list, other fields are resolved once per validation
+
+python benchmarks/dependent.py [rows]
+'''
+import sys
+import time
+from pyva import Schema
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+data = {
+    'a': 'x',
+    'b': None,
+    'c': {'d': [0, 1, 2]},
+    'items': [{'name': 'item {}'.format(i), 'price': i} for i in range(rows)],
+}
+
+schema = Schema({
+    'items.*.name': 'required_with:b,c.d,a|required_without_all:b,c.e',
+    'items.*.price': 'required_if:a,x|gte:c.d.0',
+})
+
+start = time.perf_counter()
+validator = schema.validate(data)
+elapsed = time.perf_counter() - start
+
+print('{} rows: {:.3f} s, passes={}'.format(rows, elapsed, validator.passes()))
+print('other field lookups: {}'.format(validator.resolution_info()))
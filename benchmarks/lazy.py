@@ -0,0 +1,37 @@
+'''
+Peak memory and time of validating a big list with expanded wildcard rules vs lazy validation
+
+python benchmarks/lazy.py [rows]
+'''
+import sys
+import time
+import tracemalloc
+from pyva import Schema
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+data = {
+    'users': [
+        {'name': 'user {}'.format(i), 'email': 'user{}@example.com'.format(i), 'age': 20 + i % 50}
+        for i in range(rows)
+    ]
+}
+
+schema = Schema({
+    'users': 'required|list',
+    'users.*.name': 'required|string|max:32',
+    'users.*.email': 'required|string',
+    'users.*.age': 'required|integer|between:18,100',
+})
+
+for lazy in (False, True):
+    tracemalloc.start()
+    start = time.perf_counter()
+    passed = schema.validate(data, lazy=lazy).passes()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{:<6} rows={} passed={} time={:.2f}s peak memory={:.1f} MB'.format(
+        'lazy' if lazy else 'eager', rows, passed, elapsed, peak / 1024 / 1024
+    ))
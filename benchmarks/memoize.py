@@ -0,0 +1,35 @@
+'''
+Validation of records with repeated values with and without result_cache
+
+python benchmarks/memoize.py [records]
+'''
+import sys
+import time
+from pyva import Schema
+from pyva.validator import result_cache
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+records = [
+    {
+        'email': 'user{}@example{}.com'.format(i % 50, i % 7),
+        'website': 'https://example{}.com/'.format(i % 20),
+        'ip': '10.0.{}.{}'.format(i % 3, i % 40),
+        'born': '2000-01-{:02d}'.format(i % 28 + 1),
+    }
+    for i in range(count)
+]
+
+schema = Schema({'email': 'required|email', 'website': 'url', 'ip': 'ip', 'born': 'date'})
+
+for maxsize in (0, 10000):
+    result_cache.clear()
+    result_cache.maxsize = maxsize
+
+    start = time.perf_counter()
+    schema.validate_many(records)
+    elapsed = time.perf_counter() - start
+
+    print('result_cache.maxsize={:<6} {:>8.0f} records/s  {}'.format(
+        maxsize, count / elapsed, result_cache.info()
+    ))
@@ -0,0 +1,55 @@
+'''
+Numeric helpers dispatched by type vs the str() and regex versions they replaced
+
+python benchmarks/numeric.py
+'''
+import re
+import timeit
+from numbers import Number
+from pyva import helpers
+
+
+def regex_is_int(value):
+    return True if re.match(r'[-+]?\d+$', str(value)) is not None else False
+
+
+def regex_is_float(num):
+    return isinstance(num, float) or (
+            isinstance(num, str) and num.find('.') > 0 and regex_is_int(num.replace('.', '', 1))
+    )
+
+
+def regex_is_numeric(value):
+    return True if isinstance(value, Number) or \
+                   (isinstance(value, str) and value.isnumeric()) or \
+                   regex_is_float(value) else False
+
+
+def regex_to_numeric(num):
+    if regex_is_int(num):
+        return int(num)
+    elif regex_is_float(num):
+        return float(num)
+    raise ValueError('Invalid number provided')
+
+
+values = [25, -3, 2.5, True, None, '25', '-3', '5.6', 'john', 'items.3.min', [1, 2]]
+numbers = [25, -3, 2.5, '25', '-3', '5.6']
+number = 20000
+
+helpers_pairs = [
+    ('is_int', helpers.is_int, regex_is_int, values),
+    ('is_float', helpers.is_float, regex_is_float, values),
+    ('is_numeric', helpers.is_numeric, regex_is_numeric, values),
+    ('to_numeric', helpers.to_numeric, regex_to_numeric, numbers),
+]
+
+for name, new, old, inputs in helpers_pairs:
+    def run(function):
+        return min(timeit.repeat(lambda: [function(value) for value in inputs], number=number, repeat=3))
+
+    old_time = run(old)
+    new_time = run(new)
+    print('{:<12} {:>7.0f} ns per value, regex {:>7.0f} ns, {:.1f}x'.format(
+        name, new_time / number / len(inputs) * 1e9, old_time / number / len(inputs) * 1e9, old_time / new_time
+    ))
@@ -0,0 +1,43 @@
+'''
+Throughput of validate_many() with 1, 2, 4 and 8 worker processes
+
+python benchmarks/parallel.py [records]
+'''
+import sys
+import time
+from pyva import Schema
+
+schema = Schema({
+    'id': 'required|integer',
+    'name': 'required|string|between:3,32',
+    'email': 'required|email',
+    'website': 'nullable|url',
+    'tags': 'list|max:10',
+    'tags.*': 'string|max:16',
+})
+
+
+def make_records(count):
+    return [
+        {
+            'id': i,
+            'name': 'user {}'.format(i),
+            'email': 'user{}@example.com'.format(i),
+            'website': 'https://example.com/{}'.format(i),
+            'tags': ['tag{}'.format(j) for j in range(i % 5)],
+        }
+        for i in range(count)
+    ]
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    records = make_records(count)
+
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        results = schema.validate_many(records, parallel=workers, chunk_size=2000)
+        elapsed = time.perf_counter() - start
+        print('workers={} records={} time={:.2f}s records/s={:.0f} failed={}'.format(
+            workers, count, elapsed, count / elapsed, sum(not result.passed for result in results)
+        ))
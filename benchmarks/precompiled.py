@@ -0,0 +1,66 @@
+'''
+Import and first validation latency of rules compiled with python -m pyva compile vs parsing them at startup
+
+python benchmarks/precompiled.py
+
+Every measurement runs in a fresh interpreter, pyva itself is imported before the clock starts
+'''
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pyva.precompiled import compile_rules
+
+rules = {}
+for i in range(200):
+    name = 'field{}'.format(i)
+    rules[name] = [
+        'required|string|max:32', 'nullable|integer|between:0,100', 'required|email',
+        'required_with:field0|in:a,b,c', 'list|min:1',
+    ][i % 5]
+    rules['items.*.' + name] = 'required|string|min:3'
+
+data = {'field{}'.format(i): 'value' for i in range(200)}
+data['items'] = [{'field{}'.format(i): 'value' for i in range(200)} for _ in range(5)]
+
+measure = '''
+import time, json
+import pyva
+start = time.perf_counter()
+{load}
+loaded = time.perf_counter()
+schema.validate({data!r}).passes()
+validated = time.perf_counter()
+print(json.dumps([loaded - start, validated - loaded]))
+'''
+
+paths = {
+    'dynamic Schema(rules)': 'from bench_rules import RULES\nschema = pyva.Schema(RULES)',
+    'dynamic generated()': 'from bench_rules import RULES\nschema = pyva.Schema(RULES).generated()',
+    'compiled module': 'from bench_compiled import SCHEMA as schema',
+}
+
+with tempfile.TemporaryDirectory() as directory:
+    with open(os.path.join(directory, 'bench_rules.py'), 'w') as file:
+        file.write('RULES = {!r}\n'.format(rules))
+    with open(os.path.join(directory, 'bench_compiled.py'), 'w') as file:
+        file.write(compile_rules(rules))
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, root]))
+    # deployed modules are imported from cached bytecode
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    for name, load in paths.items():
+        code = measure.format(load=load, data=data)
+        subprocess.check_output([sys.executable, '-c', code], env=env, cwd=directory)
+        runs = [
+            eval(subprocess.check_output([sys.executable, '-c', code], env=env, cwd=directory))
+            for _ in range(15)
+        ]
+        load_time = statistics.median(run[0] for run in runs)
+        first_time = statistics.median(run[1] for run in runs)
+        print('{:<24} load {:>8.2f} ms, first validation {:>8.2f} ms, total {:>8.2f} ms'.format(
+            name, load_time * 1e3, first_time * 1e3, (load_time + first_time) * 1e3
+        ))
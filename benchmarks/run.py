@@ -0,0 +1,130 @@
+'''
+Run benchmark scenarios and report operations per second and peak memory allocated by one operation
+
+python benchmarks/run.py                              run every scenario
+python benchmarks/run.py wildcards_1k flat_50_fields  run selected scenarios
+python benchmarks/run.py --save baseline.json         save results as a baseline
+python benchmarks/run.py --compare baseline.json      fail when a scenario is slower than the baseline
+                                                      by more than --threshold (0.2 = 20% by default)
+'''
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scenarios import scenarios  # noqa: E402
+
+
+def measure(operation, repeat=5, min_time=0.2):
+    '''
+    best operations per second of repeat rounds, every round runs for at least min_time seconds
+
+    :param operation:
+    :param repeat:
+    :param min_time:
+    :return: float
+    '''
+    # warm up caches, the first run is not measured
+    operation()
+
+    best = 0.0
+    for _ in range(repeat):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            operation()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, count / elapsed)
+    return best
+
+
+def allocated(operation):
+    '''
+    peak memory allocated while the operation runs, in bytes
+    '''
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(names, repeat, min_time):
+    results = {}
+    for name in names:
+        operation = scenarios[name]()
+        results[name] = {
+            'ops_per_sec': measure(operation, repeat, min_time),
+            'peak_bytes': allocated(operation),
+        }
+        print('{:<20} {:>12.1f} ops/s {:>12.1f} KiB peak'.format(
+            name, results[name]['ops_per_sec'], results[name]['peak_bytes'] / 1024
+        ))
+    return results
+
+
+def compare(results, baseline, threshold):
+    '''
+    print change of every scenario against the baseline
+
+    :return: names of scenarios slower than the baseline by more than threshold
+    '''
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(name)
+        print('{:<20} {:>+8.1%} ops/s {:>+8.1%} peak{}'.format(
+            name,
+            change,
+            result['peak_bytes'] / baseline[name]['peak_bytes'] - 1 if baseline[name]['peak_bytes'] else 0,
+            '  REGRESSION' if regressed else '',
+        ))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pyva benchmarks')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run, all by default: ' + ', '.join(scenarios))
+    parser.add_argument('--save', metavar='FILE', help='save results as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare results with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown against the baseline')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds of one measured round')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in scenarios]
+    if unknown:
+        parser.error('unknown scenarios: {}'.format(', '.join(unknown)))
+
+    results = run(args.scenarios or list(scenarios), args.repeat, args.min_time)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('\n{} slower than the baseline by more than {:.0%}'.format(', '.join(regressions), args.threshold))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+'''
+Scenarios of benchmarks/run.py, every scenario prepares its data once and returns the function to measure
+'''
+from collections import deque
+from pyva import Schema, Validator
+
+scenarios = {}
+
+
+def scenario(name):
+    def register(setup):
+        scenarios[name] = setup
+        return setup
+    return register
+
+
+@scenario('flat_50_fields')
+def flat_50_fields():
+    data = {}
+    rules = {}
+    for i in range(50):
+        kind = i % 5
+        if kind == 0:
+            data['field{}'.format(i)], rules['field{}'.format(i)] = 'value {}'.format(i), 'required|string|max:32'
+        elif kind == 1:
+            data['field{}'.format(i)], rules['field{}'.format(i)] = i, 'required|integer|between:0,100'
+        elif kind == 2:
+            data['field{}'.format(i)], rules['field{}'.format(i)] = 'b', 'required|in:a,b,c'
+        elif kind == 3:
+            data['field{}'.format(i)], rules['field{}'.format(i)] = None, 'nullable|numeric'
+        else:
+            data['field{}'.format(i)], rules['field{}'.format(i)] = [1, 2, 3], 'list|min:1'
+
+    schema = Schema(rules)
+    return lambda: schema.validate(data).passes()
+
+
+@scenario('deep_nesting')
+def deep_nesting():
+    data = {}
+    rules = {}
+    for branch in range(5):
+        node = data.setdefault('branch{}'.format(branch), {})
+        path = 'branch{}'.format(branch)
+        for depth in range(10):
+            node['name'] = 'node {}'.format(depth)
+            node['size'] = depth
+            rules[path + '.name'] = 'required|string|min:3'
+            rules[path + '.size'] = 'required|integer|min:0'
+            node = node.setdefault('child', {})
+            path += '.child'
+
+    schema = Schema(rules)
+    return lambda: schema.validate(data).passes()
+
+
+def _families(users):
+    return {
+        'users': [
+            {
+                'name': 'user {}'.format(i),
+                'family': [{'child': 'child {}'.format(j)} for j in range(2)],
+            }
+            for i in range(users // 2)
+        ]
+    }
+
+
+def _wildcards(items):
+    data = _families(items)
+    schema = Schema({
+        'users': 'required|list',
+        'users.*.name': 'required|string|max:32',
+        'users.*.family.*.child': 'required|string|min:3',
+    })
+    return lambda: schema.validate(data).passes()
+
+
+@scenario('wildcards_1k')
+def wildcards_1k():
+    return _wildcards(1000)
+
+
+@scenario('wildcards_10k')
+def wildcards_10k():
+    return _wildcards(10000)
+
+
+@scenario('wildcards_100k')
+def wildcards_100k():
+    return _wildcards(100000)
+
+
+@scenario('email_url_ip')
+def email_url_ip():
+    data = {
+        'contacts': [
+            {
+                'email': 'user{}@example{}.com'.format(i, i % 10),
+                'website': 'https://example{}.com/page/{}'.format(i % 10, i),
+                'ip': '10.0.{}.{}'.format(i % 256, (i * 7) % 256),
+                'ipv6': '2001:db8::{:x}'.format(i),
+            }
+            for i in range(200)
+        ]
+    }
+    schema = Schema({
+        'contacts.*.email': 'required|email',
+        'contacts.*.website': 'url',
+        'contacts.*.ip': 'ip',
+        'contacts.*.ipv6': 'ipv6',
+    })
+    return lambda: schema.validate(data).passes()
+
+
+@scenario('dependent_rules')
+def dependent_rules():
+    data = {
+        'country': 'US',
+        'state': 'CA',
+        'min_price': 0,
+        'items': [{'name': 'item {}'.format(i), 'price': i, 'zip': None} for i in range(1000)],
+    }
+    schema = Schema({
+        'items.*.name': 'required_with:country,state',
+        'items.*.price': 'required_if:country,US|gte:min_price',
+        'items.*.zip': 'required_without_all:country,state',
+    })
+    return lambda: schema.validate(data).passes()
+
+
+@scenario('validated_large')
+def validated_large():
+    data = {
+        'users': [
+            {'name': 'user {}'.format(i), 'email': 'user{}@example.com'.format(i), 'age': 20 + i % 50}
+            for i in range(2000)
+        ]
+    }
+    schema = Schema({
+        'users.*.name': 'required|string',
+        'users.*.email': 'required|string',
+        'users.*.age': 'required|integer',
+    })
+    return lambda: schema.validate(data).validated()
+
+
+@scenario('validated_items_large')
+def validated_items_large():
+    data = {
+        'users': [
+            {'name': 'user {}'.format(i), 'email': 'user{}@example.com'.format(i), 'age': 20 + i % 50}
+            for i in range(2000)
+        ]
+    }
+    schema = Schema({
+        'users.*.name': 'required|string',
+        'users.*.email': 'required|string',
+        'users.*.age': 'required|integer',
+    })
+    # items are consumed one by one, like by a writer
+    return lambda: deque(schema.validate(data, lazy=True).validated_items(), maxlen=0)
+
+
+@scenario('update_300_fields')
+def update_300_fields():
+    data = {'field{}'.format(i): 'value {}'.format(i) for i in range(300)}
+    rules = {'field{}'.format(i): 'required|string|max:32' for i in range(300)}
+    rules['field_confirm'] = 'required_with:field7'
+    data['field_confirm'] = 'yes'
+
+    validator = Validator(data, Schema(rules))
+    validator.passes()
+    values = ['changed', None]
+    state = {'index': 0}
+
+    def update():
+        state['index'] ^= 1
+        return validator.update('field7', values[state['index']])
+
+    return update
@@ -0,0 +1,37 @@
+'''
+Per request cost of building a new Validator vs validating with a compiled Schema
+
+python benchmarks/schema.py
+'''
+import timeit
+from pyva import Validator, Schema
+
+data = {
+    'user': {
+        'name': 'John',
+        'email': 'johndoe@example.com',
+        'age': 25,
+        'website': 'https://example.com',
+    },
+    'items': [{'title': 'item {}'.format(i), 'price': i} for i in range(10)],
+}
+
+rules = {
+    'user': 'required|dict',
+    'user.name': 'required|string|min:3|max:16',
+    'user.email': 'required|email',
+    'user.age': 'required|integer|between:18,100',
+    'user.website': 'nullable|url',
+    'items': 'required|list|max:50',
+    'items.*.title': 'required|string|max:32',
+    'items.*.price': 'required|numeric|min:0',
+}
+
+schema = Schema(rules)
+number = 2000
+
+validator_time = timeit.timeit(lambda: Validator(data, rules).passes(), number=number)
+schema_time = timeit.timeit(lambda: schema.validate(data), number=number)
+
+print('Validator(data, rules).passes(): {:.1f} us per request'.format(validator_time / number * 1e6))
+print('schema.validate(data):           {:.1f} us per request'.format(schema_time / number * 1e6))
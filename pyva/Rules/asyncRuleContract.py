@@ -0,0 +1,11 @@
+import abc
+from pyva.Rules.ruleContract import RuleContract
+
+
+class AsyncRuleContract(RuleContract):
+
+    __metaclass__ = abc.ABCMeta
+
+    @abc.abstractmethod
+    async def passes(self, attribute, value):
+        raise NotImplementedError
@@ -5,6 +5,9 @@ class RuleContract:
 
     __metaclass__ = abc.ABCMeta
 
+    # pure rule result depends only on the value, so it can be memoized in pyva.validator.result_cache
+    pure = False
+
     @abc.abstractmethod
     def passes(self, attribute, value):
         raise NotImplementedError
@@ -1,5 +1,9 @@
+__version__ = '0.4.1'
+
 from pyva.Rules.ruleContract import RuleContract
+from pyva.Rules.asyncRuleContract import AsyncRuleContract
 from pyva.validationException import ValidationException
+from pyva.schema import Schema
 from pyva.validator import Validator
 
-__all__ = ('Validator', 'RuleContract', 'ValidationException')
+__all__ = ('Validator', 'Schema', 'RuleContract', 'AsyncRuleContract', 'ValidationException')
@@ -0,0 +1,4 @@
+import sys
+from pyva.cli import main
+
+sys.exit(main())
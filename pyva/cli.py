@@ -0,0 +1,163 @@
+import argparse
+import importlib
+import json
+import sys
+import time
+from contextlib import ExitStack
+from pyva import precompiled
+from pyva.schema import Schema
+from pyva.validator import Validator
+
+
+def main(argv=None):
+    '''
+    python -m pyva validate --rules rules.json input.ndjson
+    python -m pyva compile rules_module:RULES -o compiled_rules.py
+
+    :param argv: command line arguments without the program name
+    :return: exit code, for validate 0 when every record passed, 1 when some record failed
+    '''
+    parser = argparse.ArgumentParser(prog='python -m pyva', description='pyva data validation')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    validate = commands.add_parser('validate', help='validate JSON Lines file record by record')
+    validate.add_argument('input', help='JSON Lines file, - for stdin')
+    validate.add_argument('--rules', required=True, metavar='FILE', help='JSON object with rules')
+    validate.add_argument('--messages', metavar='FILE', help='JSON object with custom messages')
+    validate.add_argument('-o', '--output', metavar='FILE', help='where to write failures, stdout by default')
+    validate.add_argument('--validated', metavar='FILE', help='write validated() data of passed records')
+    validate.add_argument('--max-errors', type=int, metavar='N', help='stop after N failed records')
+    validate.set_defaults(handler=validate_command)
+
+    compile_parser = commands.add_parser('compile', help='write module with parsed rules and generated code')
+    compile_parser.add_argument('rules', metavar='MODULE:NAME', help='rules dict, for example rules_module:RULES')
+    compile_parser.add_argument('--messages', metavar='MODULE:NAME', help='dict with custom messages')
+    compile_parser.add_argument('-o', '--output', metavar='FILE', help='where to write the module, stdout by default')
+    compile_parser.set_defaults(handler=compile_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+def validate_command(args):
+    with open(args.rules, encoding='utf-8') as file:
+        rules = json.load(file)
+    messages = None
+    if args.messages:
+        with open(args.messages, encoding='utf-8') as file:
+            messages = json.load(file)
+    schema = Schema(rules, messages)
+
+    with ExitStack() as stack:
+        source = sys.stdin if args.input == '-' else stack.enter_context(open(args.input, encoding='utf-8'))
+        output = stack.enter_context(open(args.output, 'w', encoding='utf-8')) if args.output else sys.stdout
+        validated = stack.enter_context(open(args.validated, 'w', encoding='utf-8')) if args.validated else None
+
+        summary = validate_lines(source, schema, output, validated, args.max_errors)
+
+    report(summary, sys.stderr)
+    return 1 if summary['failed'] else 0
+
+
+def compile_command(args):
+    rules = import_object(args.rules)
+    messages = import_object(args.messages) if args.messages else None
+    source = precompiled.compile_rules(rules, messages, args.rules, args.messages)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+def import_object(reference):
+    '''
+    rules_module:RULES -> RULES of rules_module
+
+    :param reference: 'module:NAME'
+    :return:
+    '''
+    module, separator, name = reference.partition(':')
+    if not separator or not module or not name:
+        raise ValueError('{!r} must be module:NAME'.format(reference))
+    return getattr(importlib.import_module(module), name)
+
+
+def validate_lines(lines, schema, output, validated=None, max_errors=None):
+    '''
+    validate every JSON line and write failures to output as JSON lines {"line": 3, "failed_rules": {...}},
+    lines are read one by one, so memory does not depend on the size of the input
+
+    :param lines: iterable of JSON strings
+    :param schema: Schema
+    :param output: file for failures
+    :param validated: file for validated() data of passed records
+    :param max_errors: stop after so many failed records
+    :return: summary dict
+    '''
+    summary = {'records': 0, 'passed': 0, 'failed': 0, 'stopped': False, 'elapsed': 0.0, 'attributes': {}}
+    attributes = summary['attributes']
+    validator = None
+    start = time.perf_counter()
+
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        summary['records'] += 1
+
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            failure = {'line': number, 'error': 'Invalid JSON: {}'.format(e)}
+        else:
+            if not isinstance(record, dict):
+                failure = {'line': number, 'error': 'Record must be JSON object, got {}'.format(type(record).__name__)}
+            else:
+                failure = None
+                try:
+                    if validator is None:
+                        validator = Validator(record, schema)
+                    else:
+                        validator._reset(record)
+                    passed = validator.passes()
+                except (TypeError, ValueError) as e:
+                    # rules like email or min raise for values of unexpected type,
+                    # one such record must not stop the stream
+                    failure = {'line': number, 'error': '{}: {}'.format(type(e).__name__, e)}
+
+                if failure is None:
+                    if passed:
+                        summary['passed'] += 1
+                        if validated is not None:
+                            validated.write(json.dumps(validator.validated(copy=False)) + '\n')
+                        continue
+
+                    failure = {'line': number, 'failed_rules': validator.failed_rules}
+                    for attribute in validator.failed_rules:
+                        pattern = validator._wildcard_keys.get(attribute, (attribute,))[0]
+                        attributes[pattern] = attributes.get(pattern, 0) + 1
+
+        summary['failed'] += 1
+        output.write(json.dumps(failure, default=str) + '\n')
+        if max_errors is not None and summary['failed'] >= max_errors:
+            summary['stopped'] = True
+            break
+
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+
+def report(summary, stream):
+    elapsed = summary['elapsed']
+    stream.write('{} records, {} passed, {} failed in {:.2f} s ({:.0f} records/s)\n'.format(
+        summary['records'], summary['passed'], summary['failed'], elapsed,
+        summary['records'] / elapsed if elapsed else 0
+    ))
+    if summary['stopped']:
+        stream.write('stopped after {} failed records\n'.format(summary['failed']))
+
+    for attribute, count in sorted(summary['attributes'].items(), key=lambda item: -item[1]):
+        stream.write('  {}: {} failed\n'.format(attribute, count))
@@ -0,0 +1,238 @@
+'''
+Code generation backend, rules of every attribute are turned into one straight-line Python function
+
+schema = Schema(rules).generated()
+Validator(data, schema).passes()
+
+Built in rules are inlined with compiled regexes and converted borders, other rules of Validator are called
+directly and custom rules (callbacks, RuleContract, params with *) go through the usual Validator path,
+so results and error messages are the same as without code generation.
+'''
+import math
+from weakref import WeakKeyDictionary
+
+# schema -> validator class -> {pattern: check function}
+_generated = WeakKeyDictionary()
+
+# Validator methods the generated code depends on, subclass which overrides them is validated without generated code
+_interpreter_methods = ('is_validatable', '_should_stop', '_validate_rules', '_Validator__validate_attribute')
+
+_prelude = """from pyva import helpers as _helpers
+from pyva import regexes as _regexes
+from pyva.validator import result_cache as _result_cache
+"""
+
+# helpers bound by the generated module when its functions use them
+_helpers = (
+    ('_is_int', '_helpers.is_int'),
+    ('_is_numeric', '_helpers.is_numeric'),
+    ('_is_date', '_helpers.is_date'),
+    ('_plausible_email', '_regexes.plausible_email'),
+    ('_email', "_regexes.builtin('email').search"),
+    ('_url', "_regexes.builtin('url').search"),
+    ('_ip', "_regexes.builtin('ip').search"),
+    ('_ipv4', "_regexes.builtin('ipv4').search"),
+    ('_ipv6', "_regexes.builtin('ipv6').search"),
+)
+
+# failure condition of inlined rules, value is already known to be validatable
+_type_checks = {
+    'string': 'not isinstance(value, str)',
+    'list': 'not isinstance(value, list)',
+    'dict': 'not isinstance(value, dict)',
+    'integer': 'not _is_int(value)',
+    'numeric': 'not _is_numeric(value)',
+    'date': 'not _is_date(value)',
+    'email': 'not (_plausible_email(value) and _email(value) is not None)',
+    'url': '_url(value) is None',
+    'ip': '_ip(value) is None',
+    'ipv4': '_ipv4(value) is None',
+    'ipv6': '_ipv6(value) is None',
+    'required': "value is None or (isinstance(value, str) and not value.strip()) or "
+                "(hasattr(value, '__len__') and len(value) < 1)",
+}
+
+# rules which always pass, nothing is generated for them
+_noop_rules = ('nullable', 'bail')
+
+
+def checks(schema, validator_class):
+    '''
+    generated check functions of the schema for the validator class, code is generated once
+
+    :param schema:
+    :param validator_class:
+    :return: dict pattern -> function, None when the class changes how rules are applied
+    '''
+    from pyva.validator import Validator
+
+    for method in _interpreter_methods:
+        if getattr(validator_class, method) is not getattr(Validator, method):
+            return None
+
+    by_class = _generated.get(schema)
+    if by_class is None:
+        by_class = _generated[schema] = {}
+    if validator_class not in by_class:
+        namespace = {}
+        exec(compile(generate(schema, validator_class), '<pyva generated>', 'exec'), namespace)
+        by_class[validator_class] = namespace['CHECKS']
+    return by_class[validator_class]
+
+
+def generate(schema, validator_class):
+    '''
+    source of module with check function for every attribute of the schema
+
+    check(v, attribute, value, failed, stop, rules) validates value of attribute and adds errors to failed,
+    rules are parsed rules of the attribute, True is returned when the whole validation must stop
+
+    :param schema:
+    :param validator_class:
+    :return: str
+    '''
+    generator = _Generator(schema, validator_class)
+    return generator.module()
+
+
+class _Generator:
+
+    def __init__(self, schema, validator_class):
+        from pyva.validator import Validator
+
+        self.schema = schema
+        self.validator_class = validator_class
+        self.base_class = Validator
+        self.constants = []
+        self.patterns = {}
+
+    def module(self):
+        functions = []
+        names = []
+        for index, (attribute, compiled) in enumerate(self.schema.attributes.items()):
+            name = 'check_{}'.format(index)
+            functions.append(self.function(name, compiled))
+            names.append('    {!r}: {},'.format(attribute, name))
+
+        # builtin regexes are compiled only when some rule uses them
+        code = ''.join(functions)
+        helpers = ['{} = {}'.format(name, value) for name, value in _helpers if name + '(' in code]
+
+        return '\n'.join(
+            [_prelude] + helpers + self.constants + [''] + functions + ['CHECKS = {'] + names + ['}', '']
+        )
+
+    def function(self, name, compiled):
+        lines = ['', 'def {}(v, attribute, value, failed, stop, rules):'.format(name)]
+        for index, rule in enumerate(compiled.rules):
+            lines.extend('    ' + line for line in self.rule(index, rule))
+            lines.append('    if stop and failed:')
+            lines.append('        return True')
+            if compiled.bail or (isinstance(rule.rule, str) and rule.rule in self.schema._implicit_rules):
+                lines.append('    if attribute in failed:')
+                lines.append('        return False')
+        lines.append('    return False')
+        lines.append('')
+        return '\n'.join(lines)
+
+    def rule(self, index, rule):
+        generic = ['v._Validator__validate_attribute(attribute, rules[{}], value)'.format(index)]
+        if rule.custom or rule.wildcard_params or not self.is_method(rule.name):
+            return generic
+
+        validatable = '' if rule.name in self.schema._implicit_rules else 'value is not None and '
+        if self.is_builtin(rule.name) and rule.name in _noop_rules:
+            return ['pass  # {}'.format(rule.name)]
+
+        condition = self.inline(rule) if self.is_builtin(rule.name) else None
+        if condition is None:
+            params = ''.join(', ' + self.literal(param, 'rules[{}].params[{}]'.format(index, position))
+                             for position, param in enumerate(rule.params))
+            condition = 'not v._validate_{}(attribute, value{})'.format(rule.name, params)
+        lines = [
+            'if {}{}:'.format(validatable, condition),
+            '    v._add_message(attribute, {!r})'.format(rule.name),
+        ]
+        if rule.name not in self.validator_class._pure_rules:
+            return lines
+
+        # same key as Validator.__validate_attribute(), so both paths share cached results
+        memoized = 'not v._memoized((v.__class__, {0!r}, tuple(rules[{1}].params)), v._validate_{0}, ' \
+                   'attribute, value, rules[{1}].params)'.format(rule.name, index)
+        return [
+            'if _result_cache.maxsize > 0:',
+            '    if {}{}:'.format(validatable, memoized),
+            '        v._add_message(attribute, {!r})'.format(rule.name),
+            'el' + lines[0],
+        ] + lines[1:]
+
+    def inline(self, rule):
+        '''
+        failure condition of the rule as Python expression, None when the rule can not be inlined
+        '''
+        name = rule.name
+        params = rule.params
+        if name in _type_checks:
+            return _type_checks[name]
+
+        if name == 're':
+            if not params or not isinstance(params[0], str):
+                return None
+            return '{}(value) is None'.format(self.pattern(params[0]))
+
+        if name == 'in':
+            literals = [self.literal(param) for param in params]
+            if None in literals:
+                return None
+            return 'value not in ({})'.format(''.join(literal + ', ' for literal in literals))
+
+        if name == 'size':
+            # only the first param is converted by _validate_size
+            try:
+                border = int(params[0])
+            except (IndexError, TypeError, ValueError):
+                return None
+            return 'v._get_size(attribute, value) != {!r}'.format(border)
+
+        if name in ('min', 'max', 'between'):
+            # boarders_to_int converts every param
+            try:
+                borders = [int(param) for param in params]
+            except (TypeError, ValueError):
+                return None
+            if not borders or (name == 'between' and len(borders) != 2):
+                return None
+            if name == 'min':
+                return 'not v._get_size(attribute, value) >= {!r}'.format(borders[0])
+            if name == 'max':
+                return 'not v._get_size(attribute, value) <= {!r}'.format(borders[0])
+            return 'not {!r} <= v._get_size(attribute, value) <= {!r}'.format(*borders)
+
+        return None
+
+    def pattern(self, pattern):
+        if pattern not in self.patterns:
+            name = self.patterns[pattern] = '_re_{}'.format(len(self.patterns))
+            self.constants.append('{} = _regexes.user_pattern({!r}).search'.format(name, pattern))
+        return self.patterns[pattern]
+
+    def is_method(self, name):
+        return isinstance(name, str) and hasattr(self.validator_class, '_validate_' + name)
+
+    def is_builtin(self, name):
+        '''
+        rule method is not overridden by the validator class, so it can be inlined
+        '''
+        method = '_validate_' + name
+        return getattr(self.validator_class, method) is getattr(self.base_class, method, None)
+
+    @staticmethod
+    def literal(value, fallback=None):
+        '''
+        value as Python literal which gives the same value, fallback when there is no such literal
+        '''
+        if value is None or type(value) in (str, int, bool):
+            return repr(value)
+        if type(value) is float and math.isfinite(value):
+            return repr(value)
+        return fallback
@@ -0,0 +1,204 @@
+from collections import namedtuple
+from pyva.schema import Schema
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, without it every rule is checked row by row
+    np = None
+
+RuleResult = namedtuple('RuleResult', ['attribute', 'rule', 'mask', 'failed'])
+
+
+class ColumnarResult:
+    '''
+    Result of validate_columns()
+
+    results - RuleResult(attribute, rule, mask, failed) for every rule of every attribute,
+    mask is True for rows which passed the rule and failed holds indexes of rows which did not
+    '''
+
+    def __init__(self, results, rows):
+        self.results = results
+        self.rows = rows
+
+    def get(self, attribute, rule):
+        for result in self.results:
+            if result.attribute == attribute and result.rule == rule:
+                return result
+        return None
+
+    def failed_rows(self):
+        rows = set()
+        for result in self.results:
+            rows.update(int(index) for index in result.failed)
+        return sorted(rows)
+
+    def passes(self):
+        return all(len(result.failed) == 0 for result in self.results)
+
+    def fails(self):
+        return not self.passes()
+
+
+def validate_columns(columns, rules, messages=None):
+    '''
+    validate data stored as columns, dict of lists or numpy arrays with the same length
+
+    columns = {'age': numpy.array([20, 15, 30]), 'name': ['John', 'Jo', 'Anna']}
+    validate_columns(columns, {'age': 'integer|min:18', 'name': 'required|min:3'}).failed_rows()  # [1]
+
+    min, max, between, size, numeric, integer, in, gt, gte, lt and lte are checked with numpy array operations
+    when the column holds numbers (or strings for in), every other rule is checked row by row with Validator
+
+    :param columns:
+    :param rules: rules dict or Schema
+    :param messages:
+    :return: ColumnarResult
+    '''
+    schema = rules if isinstance(rules, Schema) else Schema.cached(rules, messages)
+    return _ColumnValidator(columns, schema).validate()
+
+
+class _ColumnValidator:
+
+    _vector_rules = ('min', 'max', 'between', 'size', 'numeric', 'integer', 'in', 'gt', 'gte', 'lt', 'lte')
+
+    _compare = {
+        'gt': lambda left, right: left > right,
+        'gte': lambda left, right: left >= right,
+        'lt': lambda left, right: left < right,
+        'lte': lambda left, right: left <= right,
+    }
+
+    def __init__(self, columns, schema):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length')
+
+        self.columns = columns
+        self.schema = schema
+        self.rows = lengths.pop() if lengths else 0
+        self._records = None
+        self._arrays = {}
+
+    def validate(self):
+        results = []
+        for attribute, compiled in self.schema.attributes.items():
+            stopped = self._full(False)
+            failed_any = self._full(False)
+
+            for rule in compiled.rules:
+                mask = self._vector_mask(attribute, rule)
+                if mask is None:
+                    mask = self._row_mask(attribute, rule, stopped)
+
+                # rows where validation already stopped do not run the rule, see Validator._validate_attributes()
+                mask = self._or(mask, stopped)
+                failed_any = self._or(failed_any, self._not(mask))
+                if compiled.bail or (not rule.custom and rule.rule in self.schema._implicit_rules):
+                    stopped = self._or(stopped, failed_any)
+
+                results.append(RuleResult(attribute, rule.rule if rule.custom else rule.name, mask, self._failed(mask)))
+
+        return ColumnarResult(results, self.rows)
+
+    def _vector_mask(self, attribute, rule):
+        if np is None or rule.custom or rule.name not in self._vector_rules or rule.wildcard_params:
+            return None
+
+        array = self._array(attribute)
+        if array is None:
+            return None
+
+        params = rule.params
+        if array.dtype.kind in 'iu' or array.dtype == np.float64:
+            if rule.name == 'numeric':
+                return self._full(True)
+            if rule.name == 'integer':
+                return self._full(array.dtype.kind in 'iu')
+            if rule.name == 'in':
+                return np.isin(array, [param for param in params if not isinstance(param, str)])
+            if rule.name == 'size' and params:
+                return array == int(params[0])
+            if rule.name == 'min' and params:
+                return array >= int(params[0])
+            if rule.name == 'max' and params:
+                return array <= int(params[0])
+            if rule.name == 'between' and len(params) == 2:
+                return (array >= int(params[0])) & (array <= int(params[1]))
+            if rule.name in self._compare and params:
+                other = self._array(params[0]) if isinstance(params[0], str) else None
+                if other is not None and (other.dtype.kind in 'iu' or other.dtype == np.float64):
+                    return self._compare[rule.name](array, other)
+        elif array.dtype.kind == 'U' and rule.name == 'in':
+            return np.isin(array, [param for param in params if isinstance(param, str)])
+
+        return None
+
+    def _array(self, attribute):
+        '''
+        numpy array of the column when it has one type which can be checked with array operations
+        '''
+        if attribute in self._arrays:
+            return self._arrays[attribute]
+
+        column = self.columns.get(attribute) if isinstance(attribute, str) else None
+        array = None
+        if isinstance(column, np.ndarray):
+            array = column
+        elif isinstance(column, (list, tuple)):
+            # python values must have one type, mixed ints and floats would lose the difference for integer rule
+            types = set(map(type, column))
+            if types == {int} or types == {float} or types == {str}:
+                try:
+                    array = np.asarray(column)
+                except OverflowError:
+                    array = None
+                if array is not None and array.dtype.kind == 'O':
+                    array = None
+
+        self._arrays[attribute] = array
+        return array
+
+    def _row_mask(self, attribute, rule, stopped):
+        from pyva.validator import Validator
+
+        schema = Schema({attribute: [rule.rule]}, self.schema.messages)
+        validator = None
+        mask = []
+        for index, record in enumerate(self._rows()):
+            if stopped[index]:
+                mask.append(True)
+                continue
+            if validator is None:
+                validator = Validator(record, schema)
+            else:
+                validator._reset(record)
+            mask.append(validator.passes())
+
+        return np.array(mask, dtype=bool) if np is not None else mask
+
+    def _rows(self):
+        if self._records is None:
+            self._records = [
+                {name: column[index] for name, column in self.columns.items()} for index in range(self.rows)
+            ]
+        return self._records
+
+    def _full(self, value):
+        return np.full(self.rows, value, dtype=bool) if np is not None else [value] * self.rows
+
+    def _or(self, left, right):
+        if np is not None:
+            return left | right
+        return [a or b for a, b in zip(left, right)]
+
+    def _not(self, mask):
+        if np is not None:
+            return ~mask
+        return [not value for value in mask]
+
+    def _failed(self, mask):
+        if np is not None:
+            return np.flatnonzero(~mask)
+        return [index for index, passed in enumerate(mask) if not passed]
@@ -1,6 +1,7 @@
 import re
 from numbers import Number
 import copy
+from functools import lru_cache
 from dateutil.parser import parse
 
 
@@ -8,23 +9,69 @@ def fn_exists(fn):
     return fn in dir(__builtins__)
 
 
+_int_pattern = re.compile(r'[-+]?\d+$')
+
+# str() of ints between them always has only digits, bigger ones can exceed the interpreter limit of digits
+_int_min = -10 ** 600
+_int_max = 10 ** 600
+
+_number_types = frozenset((int, float, bool, complex))
+
+# neither numbers nor strings, str() of them never looks like number
+_other_types = frozenset((type(None), list, dict, tuple, set, bytes))
+
+
 def is_int(value):
-    return True if re.match("[-+]?\d+$", str(value)) is not None else False
+    value_type = type(value)
+    if value_type is str:
+        return _is_int_string(value)
+    if value_type is int and _int_min < value < _int_max:
+        return True
+    if value_type is bool or value_type is float or value_type in _other_types:
+        # 'True', '5.0', 'inf', 'None' and '[5]' never look like int
+        return False
+    return _int_pattern.match(str(value)) is not None
+
+
+def _is_int_string(value):
+    # the same as [-+]?\d+$, $ matches before the trailing new line too and \d is any Unicode decimal digit
+    if value[-1:] == '\n':
+        value = value[:-1]
+    if value[:1] in ('-', '+'):
+        value = value[1:]
+    return value.isdecimal()
 
 
 def is_numeric(value):
+    value_type = type(value)
+    if value_type in _number_types:
+        return True
+    if value_type is str:
+        return value.isnumeric() or (value.find('.') > 0 and _is_int_string(value.replace('.', '', 1)))
+    if value_type in _other_types:
+        return False
     return True if isinstance(value, Number) or \
                    (isinstance(value, str) and value.isnumeric()) or \
                    is_float(value) else False
 
 
 def is_float(num):
+    num_type = type(num)
+    if num_type is float:
+        return True
+    if num_type is str:
+        return num.find('.') > 0 and _is_int_string(num.replace('.', '', 1))
+    if num_type in _other_types:
+        return False
     return isinstance(num, float) or (
             isinstance(num, str) and num.find('.') > 0 and is_int(num.replace('.', '', 1))
     )
 
 
 def to_numeric(num):
+    num_type = type(num)
+    if (num_type is int and _int_min < num < _int_max) or num_type is float:
+        return num
     if is_int(num):
         return int(num)
     elif is_float(num):
@@ -66,20 +113,8 @@ def data_get(key, data, default=None):
     :param data:
     :return:
     '''
-    if key in data:
-        return data[key]
-    try:
-        values = data.copy()
-        for part in key.split('.'):
-            casted_index = int(part) if is_int(part) else part
-            if has_key(casted_index, values):
-                values = values[casted_index]
-            else:
-                return default
-        return values
-    except:
-        pass
-    return default
+    present, value = data_lookup(key, data)
+    return value if present else default
 
 
 def data_has(key, data):
@@ -108,16 +143,54 @@ def data_has(key, data):
     :param data:
     :return:
     '''
+    return data_lookup(key, data)[0]
+
+
+@lru_cache(maxsize=4096)
+def compile_path(key):
+    '''
+    split key into segments once, numeric segments are list indexes
+
+    users.0.name -> ('users', 0, 'name')
+
+    :param key:
+    :return: tuple
+    '''
+    return tuple(int(part) if is_int(part) else part for part in key.split('.'))
+
+
+def resolve_path(path, data):
+    '''
+    walk compiled path in data without copying it
+
+    :param path: segments from compile_path()
+    :param data:
+    :return: (present, value) tuple, value is None when key is not present
+    '''
+    for part in path:
+        try:
+            data = data[part]
+        except (KeyError, TypeError, IndexError):
+            return False, None
+    return True, data
+
+
+def data_lookup(key, data, path=None):
+    '''
+    resolve key in data, key like user.name is checked as a whole first and then as a path
+
+    :param key:
+    :param data:
+    :param path: already compiled path of the key
+    :return: (present, value) tuple
+    '''
     if key in data:
-        return True
-    values = data.copy()
-    for part in key.split('.'):
-        part = int(part) if is_int(part) else part
-        if has_key(part, values):
-            values = values[part]
-        else:
-            return False
-    return True
+        return True, data[key]
+    if path is None:
+        if not isinstance(key, str):
+            return False, None
+        path = compile_path(key)
+    return resolve_path(path, data)
 
 
 def has_key(key, data):
@@ -129,21 +202,29 @@ def has_key(key, data):
 
 
 def data_set(data, keys, value):
-    segments = keys.split('.')
-    while len(segments) > 1:
-        segment = segments.pop(0)
+    path_set(data, compile_path(keys), copy.deepcopy(value))
+
 
-        if is_int(segment):
-            segment = int(segment)
+def path_set(data, path, value):
+    '''
+    set value at compiled path, missing dicts and lists on the way are created, value is not copied
+
+    :param data:
+    :param path: segments from compile_path()
+    :param value:
+    :return:
+    '''
+    last = len(path) - 1
+    for position in range(last):
+        segment = path[position]
+        if type(segment) is int:
             if not has_key(segment, data):
                 if isinstance(data, list):
-                    array_set(data, segment, [] if is_int(segments[0]) else {})
+                    array_set(data, segment, [] if type(path[position + 1]) is int else {})
         elif segment not in data:
-            array_set(data, segment, [] if is_int(segments[0]) else {})
+            array_set(data, segment, [] if type(path[position + 1]) is int else {})
         data = data[segment]
-    index = segments.pop(0)
-    index = int(index) if is_int(index) else index
-    array_set(data, index, copy.deepcopy(value))
+    array_set(data, path[last], value)
 
 
 def array_set(data, index, value):
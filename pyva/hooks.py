@@ -0,0 +1,96 @@
+class ValidationHook:
+    '''
+    Called around every rule the validator runs, extend it and pass instances to Validator(hooks=[...])
+
+    attribute - concrete attribute (users.5.email)
+    pattern - attribute as it is written in rules (users.*.email)
+    rule - rule name, callback or RuleContract, see CompiledAttribute.names
+    '''
+
+    def before_rule(self, validator, attribute, pattern, rule):
+        pass
+
+    def after_rule(self, validator, attribute, pattern, rule, passed, elapsed):
+        '''
+        :param validator:
+        :param attribute:
+        :param pattern:
+        :param rule:
+        :param passed: False when the rule added error or raised
+        :param elapsed: seconds spent in the rule
+        '''
+        pass
+
+
+class RuleMetrics(ValidationHook):
+    '''
+    Call count, cumulative time and failure count of rules, per rule name and per attribute pattern
+
+    metrics = RuleMetrics()
+    Validator(data, rules, hooks=[metrics]).passes()
+    metrics.as_dict()
+    '''
+
+    def __init__(self):
+        # name -> [calls, time, failures]
+        self.rules = {}
+        # pattern -> name -> [calls, time, failures]
+        self.patterns = {}
+
+    def after_rule(self, validator, attribute, pattern, rule, passed, elapsed):
+        name = rule_name(rule)
+        failed = 0 if passed else 1
+
+        counters = self.rules.get(name)
+        if counters is None:
+            counters = self.rules[name] = [0, 0.0, 0]
+        counters[0] += 1
+        counters[1] += elapsed
+        counters[2] += failed
+
+        rules = self.patterns.get(pattern)
+        if rules is None:
+            rules = self.patterns[pattern] = {}
+        counters = rules.get(name)
+        if counters is None:
+            counters = rules[name] = [0, 0.0, 0]
+        counters[0] += 1
+        counters[1] += elapsed
+        counters[2] += failed
+
+    def as_dict(self):
+        '''
+        {
+            'rules': {'email': {'calls': 10, 'time': 0.0002, 'failures': 1}},
+            'patterns': {'users.*.email': {'email': {'calls': 10, 'time': 0.0002, 'failures': 1}}},
+        }
+
+        :return: dict
+        '''
+        return {
+            'rules': {name: _export(counters) for name, counters in self.rules.items()},
+            'patterns': {
+                pattern: {name: _export(counters) for name, counters in rules.items()}
+                for pattern, rules in self.patterns.items()
+            },
+        }
+
+    def clear(self):
+        self.rules.clear()
+        self.patterns.clear()
+
+
+def rule_name(rule):
+    '''
+    name of the rule for reports, class name of RuleContract and function name of callbacks
+    '''
+    if isinstance(rule, str):
+        return rule
+    if callable(rule) and hasattr(rule, '__name__'):
+        return rule.__name__
+    return rule.__class__.__name__
+
+
+def _export(counters):
+    calls, elapsed, failures = counters
+    return {'calls': calls, 'time': elapsed, 'failures': failures}
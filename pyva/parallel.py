@@ -0,0 +1,77 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# validator class and schema of the worker process, set once by _init_worker()
+_worker_state = None
+
+
+def validate_parallel(records, schema, validator_class, lazy=False, workers=None, chunk_size=1000):
+    '''
+    validate records in worker processes, results are produced in the order of records
+
+    schema is pickled once and sent to every worker when it starts, records are sent in chunks
+
+    :param records: iterable of data to validate
+    :param schema: Schema
+    :param validator_class: Validator or its subclass
+    :param lazy:
+    :param workers: number of worker processes, None or True for os.cpu_count()
+    :param chunk_size: number of records sent to worker at once
+    :return: generator of RecordResult
+    '''
+    if workers is None or workers is True:
+        workers = os.cpu_count() or 1
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    try:
+        payload = pickle.dumps((validator_class, schema, lazy))
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(
+            'Rules must be picklable for parallel validation, use module level functions '
+            'and RuleContract classes instead of lambdas and nested functions: {}'.format(e)
+        ) from e
+
+    # rules are checked above, before the first result is requested
+    return _results(iter(records), payload, workers, chunk_size)
+
+
+def _results(records, payload, workers, chunk_size):
+    from pyva.validator import RecordResult
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(payload,)) as executor:
+        pending = deque()
+        offset = 0
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if chunk:
+                pending.append((offset, executor.submit(_validate_chunk, chunk)))
+                offset += len(chunk)
+
+            # keep limited amount of chunks in flight, so records are not read ahead without a bound
+            while pending and (not chunk or len(pending) > workers * 2):
+                start, future = pending.popleft()
+                size, failures = future.result()
+                for index in range(size):
+                    errors = failures.get(index)
+                    yield RecordResult(start + index, errors is None, errors)
+
+            if not chunk:
+                break
+
+
+def _init_worker(payload):
+    global _worker_state
+    _worker_state = pickle.loads(payload)
+
+
+def _validate_chunk(chunk):
+    validator_class, schema, lazy = _worker_state
+    failures = {}
+    for result in validator_class._validate_records(chunk, schema, lazy):
+        if not result.passed:
+            failures[result.index] = result.errors
+    return len(chunk), failures
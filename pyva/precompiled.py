@@ -0,0 +1,170 @@
+'''
+Rules compiled ahead of time into a plain Python module
+
+python -m pyva compile rules_module:RULES -o compiled_rules.py
+
+from compiled_rules import SCHEMA
+SCHEMA.validate(data).passes()
+
+The module holds parsed rules as literals and the check functions of pyva.codegen, so importing it does no
+rule parsing and no code generation. It is stamped with the pyva version and refuses to load with another one.
+'''
+import math
+import pyva
+import pyva.codegen as codegen
+from pyva.schema import Schema
+from pyva.validator import Validator
+
+# changes whenever the layout of compiled modules changes
+FORMAT = 1
+
+
+def check_version(module, version, format_version):
+    '''
+    called by compiled module on import, stale module must be compiled again
+
+    :param module: name of the compiled module
+    :param version: pyva version the module was compiled with
+    :param format_version:
+    :return:
+    '''
+    if version != pyva.__version__ or format_version != FORMAT:
+        raise ValueError('{} was compiled with pyva {} (format {}), installed pyva {} (format {}), '
+                         'compile the rules again'.format(module, version, format_version, pyva.__version__, FORMAT))
+
+
+def load(initial_rules, messages, attributes, checks):
+    '''
+    build Schema from parsed attributes of compiled module, nothing is parsed or generated
+
+    :param initial_rules:
+    :param messages:
+    :param attributes: CompiledAttribute instances
+    :param checks: CHECKS of the generated code
+    :return: Schema
+    '''
+    schema = Schema.__new__(Schema)
+    schema.__setstate__({
+        'initial_rules': initial_rules,
+        'messages': messages,
+        'attributes': {compiled.attribute: compiled for compiled in attributes},
+        'codegen': True,
+    })
+    codegen._generated[schema] = {Validator: checks}
+    return schema
+
+
+def compile_rules(rules, messages=None, rules_source=None, messages_source=None):
+    '''
+    source of module with the rules parsed and the check functions generated
+
+    callbacks, RuleContract instances and other values without literal are imported from the module they
+    were defined in, so rules_source is required for them
+
+    :param rules:
+    :param messages:
+    :param rules_source: 'module:NAME' of the rules
+    :param messages_source: 'module:NAME' of the messages
+    :return: str
+    '''
+    schema = Schema(rules, messages)
+    return _Writer(schema, rules_source, messages_source).module()
+
+
+class _Writer:
+
+    def __init__(self, schema, rules_source, messages_source):
+        self.schema = schema
+        self.sources = {'_rules_source': rules_source, '_messages_source': messages_source}
+        self.imports = []
+
+    def module(self):
+        initial_rules = self.literal(self.schema.initial_rules, '_rules_source.copy()', '_rules_source')
+        messages = self.literal(self.schema.messages, 'dict(_messages_source)', '_messages_source')
+        attributes = [self.attribute(compiled) for compiled in self.schema.attributes.values()]
+
+        return '\n'.join([
+            '# compiled by python -m pyva compile, do not edit',
+            'from pyva import precompiled as _precompiled',
+            '',
+            '_precompiled.check_version(__name__, {!r}, {!r})'.format(pyva.__version__, FORMAT),
+            '',
+            'from pyva.schema import ParsedRule as _ParsedRule, CompiledAttribute as _CompiledAttribute',
+        ] + self.imports + [
+            codegen.generate(self.schema, Validator),
+            'SCHEMA = _precompiled.load(',
+            '    {},'.format(initial_rules),
+            '    {},'.format(messages),
+            '    (',
+        ] + [line for attribute in attributes for line in attribute] + [
+            '    ),',
+            '    CHECKS,',
+            ')',
+            '',
+        ])
+
+    def attribute(self, compiled):
+        source = '_rules_source[{!r}]'.format(compiled.attribute)
+        tokens = self.schema.initial_rules[compiled.attribute]
+        lines = ['        _CompiledAttribute.restore({!r}, ('.format(compiled.attribute)]
+        for index, rule in enumerate(compiled.rules):
+            token = '{}[{}]'.format(source, index) if not isinstance(tokens, str) else None
+            lines.append('            {},'.format(self.rule(rule, token)))
+        lines.append('        ), {}, {}),'.format(self.literal(compiled.path), self.literal(compiled.wildcard)))
+        return lines
+
+    def rule(self, rule, token):
+        if rule.custom:
+            return '_ParsedRule({})'.format(self.literal(rule.rule, token, '_rules_source'))
+
+        # params of list rules are the items after the name, numeric ones are converted to int or float
+        params = tuple(
+            self.literal(param, token and '{}[{}]'.format(token, position + 1), '_rules_source')
+            for position, param in enumerate(rule.params)
+        )
+        return '_ParsedRule({}, {!r}, {}, {!r}, {!r})'.format(
+            self.literal(rule.rule, token, '_rules_source'), rule.name,
+            _tuple(params), rule.implicit, rule.wildcard_params
+        )
+
+    def literal(self, value, fallback=None, source=None):
+        '''
+        value as Python literal, fallback expression when there is none
+        '''
+        literal = _literal(value)
+        if literal is not None:
+            return literal
+        if fallback is None or self.sources[source] is None:
+            raise ValueError('{!r} can not be written as literal, compile rules with module:NAME'.format(value))
+        self.add_import(source)
+        return fallback
+
+    def add_import(self, name):
+        module, attribute = self.sources[name].split(':', 1)
+        line = 'from {} import {} as {}'.format(module, attribute, name)
+        if line not in self.imports:
+            self.imports.append(line)
+
+
+def _literal(value):
+    if value is None or type(value) in (str, int, bool):
+        return repr(value)
+    if type(value) is float:
+        return repr(value) if math.isfinite(value) else 'float({!r})'.format(repr(value))
+    if type(value) in (list, tuple):
+        items = [_literal(item) for item in value]
+        if None in items:
+            return None
+        if type(value) is tuple:
+            return _tuple(items)
+        return '[{}]'.format(', '.join(items))
+    if type(value) is dict:
+        items = [(_literal(key), _literal(item)) for key, item in value.items()]
+        if any(key is None or item is None for key, item in items):
+            return None
+        return '{{{}}}'.format(', '.join('{}: {}'.format(key, item) for key, item in items))
+    return None
+
+
+def _tuple(items):
+    return '({})'.format(items[0] + ',' if len(items) == 1 else ', '.join(items))
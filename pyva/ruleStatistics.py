@@ -0,0 +1,48 @@
+from pyva.hooks import ValidationHook
+
+
+class RuleStatistics(ValidationHook):
+    '''
+    How many times every rule of every attribute ran and failed, collected while validating
+
+    statistics = RuleStatistics()
+    for record in records:
+        Validator(record, schema, statistics=statistics).passes()
+
+    fast_schema = schema.optimized(statistics)
+
+    Expanded attributes are counted under their pattern, users.5.name is counted as users.*.name
+    '''
+
+    def __init__(self):
+        self.runs = {}
+        self.failures = {}
+
+    def after_rule(self, validator, attribute, pattern, rule, passed, elapsed):
+        self.record(pattern, rule, passed)
+
+    def record(self, pattern, rule, passed):
+        '''
+        :param pattern: attribute or wildcard pattern
+        :param rule: rule name, callback or RuleContract, see CompiledAttribute.names
+        :param passed:
+        '''
+        key = (pattern, rule)
+        self.runs[key] = self.runs.get(key, 0) + 1
+        if not passed:
+            self.failures[key] = self.failures.get(key, 0) + 1
+
+    def failure_rate(self, pattern, rule):
+        '''
+        :param pattern:
+        :param rule:
+        :return: float from 0 to 1, None if the rule never ran
+        '''
+        runs = self.runs.get((pattern, rule))
+        if not runs:
+            return None
+        return self.failures.get((pattern, rule), 0) / runs
+
+    def clear(self):
+        self.runs.clear()
+        self.failures.clear()
@@ -0,0 +1,385 @@
+import pyva.helpers as helpers
+from pyva import RuleContract
+from pyva.lruCache import LRUCache
+from functools import lru_cache
+from types import MappingProxyType
+
+
+class ParsedRule:
+    '''
+    Single rule of an attribute, split and normalized once.
+
+    rule - the rule exactly as it was given ('min:3', ['min', 3], callback or RuleContract)
+    name - rule name used to find the _validate_<name> method, None for callbacks and RuleContract
+    params - rule parameters, numeric parameters are already converted
+    '''
+
+    __slots__ = ('rule', 'name', 'params', 'custom', 'implicit', 'wildcard_params')
+
+    def __init__(self, rule, name=None, params=(), implicit=False, wildcard_params=False):
+        self.rule = rule
+        self.name = name
+        self.params = params
+        self.custom = name is None
+        self.implicit = implicit
+        # dependent rules like required_with:users.*.name must resolve * at validation time
+        self.wildcard_params = wildcard_params
+
+    def __repr__(self):
+        return 'ParsedRule({!r})'.format(self.rule)
+
+
+class CompiledAttribute:
+    '''
+    Attribute (it can be wildcard pattern like users.*.name) with its parsed rules
+
+    path - compiled path of the attribute, None for wildcard patterns
+    wildcard - for patterns, (names, path) of the parts between * segments
+    bail - stop validating the attribute after the first failed rule
+    '''
+
+    __slots__ = ('attribute', 'rules', 'names', 'is_wildcard', 'path', 'wildcard', 'bail')
+
+    def __init__(self, attribute, rules):
+        self.attribute = attribute
+        self.rules = rules
+        self.names = tuple(rule.rule if rule.custom else rule.name for rule in rules)
+        self.bail = 'bail' in self.names
+        self.is_wildcard = '*' in attribute.split('.')
+        self.path = None if self.is_wildcard else helpers.compile_path(attribute)
+        self.wildcard = self._split_wildcard(attribute) if self.is_wildcard else None
+
+    @classmethod
+    def restore(cls, attribute, rules, path, wildcard):
+        '''
+        attribute with path and wildcard computed earlier, used by modules of pyva.precompiled
+
+        :param attribute:
+        :param rules: ParsedRule tuple
+        :param path:
+        :param wildcard:
+        :return: CompiledAttribute
+        '''
+        compiled = cls.__new__(cls)
+        compiled.attribute = attribute
+        compiled.rules = rules
+        compiled.names = tuple(rule.rule if rule.custom else rule.name for rule in rules)
+        compiled.bail = 'bail' in compiled.names
+        compiled.is_wildcard = wildcard is not None
+        compiled.path = path
+        compiled.wildcard = wildcard
+        return compiled
+
+    @staticmethod
+    def _split_wildcard(attribute):
+        # users.*.family.*.child -> ('users',), ('family',), ('child',)
+        groups = [[]]
+        for part in attribute.split('.'):
+            if part == '*':
+                groups.append([])
+            else:
+                groups[-1].append(part)
+
+        wildcard = [(tuple(groups[0]), helpers.compile_path('.'.join(groups[0])))]
+        for names in groups[1:]:
+            wildcard.append((tuple(names), helpers.compile_path('.'.join(names)) if names else ()))
+        return tuple(wildcard)
+
+    def expand(self, data):
+        '''
+        walk data once and yield every concrete attribute of the wildcard pattern
+
+        users.*.name -> ('users.0.name', ('users', 0, 'name'), ('0',)), ('users.1.name', ...)
+
+        when there is nothing to iterate * is replaced with 0, so the rules are still applied to users.0.name
+
+        :param data:
+        :return: generator of (attribute, path, keys) tuples
+        '''
+        names, path = self.wildcard[0]
+        present, value = helpers.data_lookup('.'.join(names), data, path)
+        return self._expand(value, 1, names, path, ())
+
+    def _expand(self, value, index, names, path, keys):
+        if not value:
+            yield self._missing(index, names, path, keys)
+            return
+
+        group_names, group_path = self.wildcard[index]
+        last = index == len(self.wildcard) - 1
+
+        for key, item in helpers.foreach(value):
+            key_name = str(key)
+            if type(key) is int:
+                key_path = (key,)
+            else:
+                # keys are parsed the same way as in the attribute string, users.5 is list index
+                key_path = helpers.compile_path(key_name)
+                if key_path != (key,):
+                    item = helpers.resolve_path(key_path, value)[1]
+
+            child_names = names + (key_name,) + group_names
+            child_path = path + key_path + group_path
+            child_keys = keys + (key_name,)
+
+            if last:
+                yield '.'.join(child_names), child_path, child_keys
+            else:
+                nested = helpers.resolve_path(group_path, item)[1]
+                yield from self._expand(nested, index + 1, child_names, child_path, child_keys)
+
+    def _missing(self, index, names, path, keys):
+        for group_names, group_path in self.wildcard[index:]:
+            names = names + ('0',) + group_names
+            path = path + (0,) + group_path
+            keys = keys + ('0',)
+        return '.'.join(names), path, keys
+
+    def __repr__(self):
+        return 'CompiledAttribute({!r}, {!r})'.format(self.attribute, self.rules)
+
+
+class Schema:
+    '''
+    Rules parsed once and ready to validate any amount of data
+
+    schema = Schema({'name': 'required|min:3'})
+    schema.validate({'name': 'John'}).passes()
+    '''
+
+    _implicit_rules = (
+        'required',
+        'required_with',
+        'required_with_all',
+        'required_without',
+        'required_without_all',
+        'required_if',
+        'required_unless',
+        'present',
+    )
+
+    _dependent_rules = (
+        'required_with', 'required_with_all', 'required_without', 'required_without_all',
+        'required_if', 'required_unless', 'confirmed', 'same', 'different', 'unique',
+        'before', 'after', 'before_or_equal', 'after_or_equal', 'gt', 'lt', 'gte', 'lte',
+    )
+
+    _regex_rules = ('re',)
+
+    # rules which keep their position when rules are reordered by optimized()
+    _fixed_rules = _implicit_rules + ('nullable', 'bail')
+
+    # type rules run before other rules between fixed ones, rules like email raise for values of other type
+    _guard_rules = ('string', 'integer', 'numeric', 'list', 'dict')
+
+    # estimated relative cost of built in rules, used by optimized()
+    _rule_costs = {
+        'string': 1, 'list': 1, 'dict': 1, 'in': 1,
+        'integer': 2, 'numeric': 2, 'size': 2, 'min': 2, 'max': 2, 'between': 2,
+        'gt': 3, 'gte': 3, 'lt': 3, 'lte': 3,
+        'ipv4': 8, 'ipv6': 8, 'ip': 10, 'url': 10, 're': 10,
+        'email': 20, 'date': 30,
+    }
+
+    _default_rule_cost = 5
+
+    _custom_rule_cost = 50
+
+    # validate with functions generated by pyva.codegen, see generated()
+    codegen = False
+
+    def __init__(self, rules, messages=None):
+        self.initial_rules = rules.copy()
+        self.messages = {} if messages is None else dict(messages)
+        self.attributes = MappingProxyType(self.compile(rules))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['attributes'] = dict(self.attributes)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.attributes = MappingProxyType(state['attributes'])
+
+    @classmethod
+    def cached(cls, rules, messages=None):
+        '''
+        return parsed Schema from the process wide schema_cache, rules are parsed only on a cache miss.
+        Cache key is built from the content of rules and messages, so mutated dict gets its own Schema
+
+        :param rules:
+        :param messages:
+        :return: Schema
+        '''
+        try:
+            key = (cls, _freeze(rules), _freeze(messages))
+            hash(key)
+        except TypeError:
+            # some custom rule is not hashable, nothing to build the key from
+            return cls(rules, messages)
+
+        schema = schema_cache.get(key)
+        if schema is None:
+            schema = cls(rules, messages)
+            schema_cache.put(key, schema)
+        return schema
+
+    def compile(self, rules: dict):
+        compiled = {}
+        for attribute, rule in rules.items():
+            split_rule = rule.split('|') if isinstance(rule, str) else rule
+            compiled[attribute] = CompiledAttribute(attribute, tuple(self.parse_rule(r) for r in split_rule))
+        return compiled
+
+    def parse_rule(self, rule):
+        if callable(rule) or isinstance(rule, RuleContract):
+            return ParsedRule(rule)
+
+        name, params = self.split_rule(rule)
+
+        wildcard_params = name in self._dependent_rules and any(isinstance(p, str) and '*' in p for p in params)
+        if not wildcard_params:
+            params = to_numeric_params(params)
+
+        return ParsedRule(rule, name, tuple(params), name in self._implicit_rules, wildcard_params)
+
+    def split_rule(self, rule):
+        if isinstance(rule, list):
+            return [rule[0], rule[1:]]
+
+        parsed = rule.split(':', 1)
+        name = parsed.pop(0)
+        if len(parsed) == 0:
+            return [name, []]
+
+        if name in self._regex_rules:
+            return [name, parsed]
+
+        return [name, parsed[0].split(',')]
+
+    def optimized(self, statistics=None):
+        '''
+        copy of the schema where rules of every attribute are reordered, cheapest rules run first.
+
+        required*, present, nullable and bail keep their position, only rules between them are reordered.
+        With RuleStatistics rules are ordered by cost / failure rate, so when validation stops at the first
+        failure (bail, stop_on_first_failure, is_valid()) the rule which fails most often runs early
+
+        :param statistics: RuleStatistics collected by earlier validations
+        :return: Schema
+        '''
+        schema = self.__class__.__new__(self.__class__)
+        schema.__dict__.update(self.__dict__)
+        schema.attributes = MappingProxyType({
+            attribute: CompiledAttribute(attribute, self._reorder(compiled, statistics))
+            for attribute, compiled in self.attributes.items()
+        })
+        return schema
+
+    def generated(self):
+        '''
+        copy of the schema validated by code generated for its rules, see pyva.codegen.
+        Code is generated on the first validation, results are the same as without it
+
+        :return: Schema
+        '''
+        schema = self.__class__.__new__(self.__class__)
+        schema.__dict__.update(self.__dict__)
+        schema.codegen = True
+        return schema
+
+    def _reorder(self, compiled, statistics):
+        rules = []
+        movable = []
+        for rule, name in zip(compiled.rules, compiled.names):
+            if not rule.custom and rule.name in self._fixed_rules:
+                rules.extend(sorted(movable, key=lambda item: self._rank(compiled.attribute, *item, statistics)))
+                rules.append((rule, name))
+                movable = []
+            else:
+                movable.append((rule, name))
+        rules.extend(sorted(movable, key=lambda item: self._rank(compiled.attribute, *item, statistics)))
+
+        return tuple(rule for rule, name in rules)
+
+    def _rank(self, attribute, rule, name, statistics):
+        return not self._is_guard(rule), self._cost(attribute, rule, name, statistics)
+
+    def _is_guard(self, rule):
+        return not rule.custom and rule.name in self._guard_rules
+
+    def _cost(self, attribute, rule, name, statistics):
+        if rule.custom:
+            cost = self._custom_rule_cost
+        else:
+            cost = self._rule_costs.get(rule.name, self._default_rule_cost)
+
+        failure_rate = statistics.failure_rate(attribute, name) if statistics is not None else None
+        if failure_rate is None:
+            return cost
+        # rule which never fails is checked last, the cost of it is paid for every valid value anyway
+        return cost / max(failure_rate, 0.001)
+
+    def validate(self, data, lazy=False, stop_on_first_failure=False, statistics=None, hooks=None):
+        '''
+        validate data and return validator with the result
+
+        :param data:
+        :param lazy: expand wildcard rules while validating instead of storing every expanded attribute
+        :param stop_on_first_failure: stop validation after the first failed rule
+        :param statistics: RuleStatistics to collect failure rates of rules into
+        :param hooks: ValidationHook instances called around every rule
+        :return: Validator
+        '''
+        from pyva.validator import Validator
+
+        validator = Validator(
+            data, self, lazy=lazy, stop_on_first_failure=stop_on_first_failure, statistics=statistics, hooks=hooks
+        )
+        validator.passes()
+        return validator
+
+    def validate_many(self, records, lazy=False, iterator=False, parallel=None, chunk_size=1000, hooks=None):
+        '''
+        validate every record, see Validator.validate_many()
+
+        :param records:
+        :param lazy:
+        :param iterator: return generator instead of list
+        :param parallel: number of worker processes
+        :param chunk_size:
+        :param hooks: ValidationHook instances called around every rule
+        :return: list of RecordResult(index, passed, errors)
+        '''
+        from pyva.validator import Validator
+
+        return Validator.validate_many(
+            records, self, lazy=lazy, iterator=iterator, parallel=parallel, chunk_size=chunk_size, hooks=hooks
+        )
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return value
+    # callbacks and RuleContract instances are compared by identity, numbers keep their type (1, 1.0 and True)
+    return type(value), value
+
+
+def to_numeric_params(params):
+    return [_string_param(val) if type(val) is str else _numeric_param(val) for val in params]
+
+
+def _numeric_param(param):
+    return helpers.to_numeric(param) if helpers.is_numeric(param) else param
+
+
+# params of rules with * are converted again on every validation, the same strings repeat a lot
+_string_param = lru_cache(maxsize=4096)(_numeric_param)
+
+
+schema_cache = LRUCache(maxsize=256)
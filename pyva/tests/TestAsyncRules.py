@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from pyva import AsyncRuleContract, Validator
+
+
+class UsernameService:
+    '''
+    in process stand-in for a remote service, every call takes some time
+    '''
+
+    def __init__(self, taken):
+        self.taken = taken
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def exists(self, username):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return username in self.taken
+
+
+class Unique(AsyncRuleContract):
+
+    def __init__(self, service):
+        self.service = service
+
+    async def passes(self, attribute, value):
+        return not await self.service.exists(value)
+
+    def message(self, attribute, value):
+        return '{} is already taken'.format(value)
+
+
+class UniqueAsyncMessage(Unique):
+
+    async def message(self, attribute, value):
+        return '{} is taken'.format(value)
+
+
+class TestAsyncRules(unittest.TestCase):
+
+    def test_passes_async(self):
+        service = UsernameService({'john'})
+        v = Validator({
+            'users': [{'name': 'john'}, {'name': 'anna'}, {'name': 'david'}],
+        }, {
+            'users.*.name': ['required', 'string', Unique(service)],
+        })
+
+        self.assertFalse(asyncio.run(v.passes_async()))
+        self.assertEqual({'users.0.name': ['john is already taken']}, v.failed_rules)
+        self.assertEqual(3, service.calls)
+        self.assertEqual(3, service.max_running)
+
+    def test_concurrency_limit(self):
+        service = UsernameService(set())
+        v = Validator({
+            'users': [{'name': 'user {}'.format(i)} for i in range(10)],
+        }, {
+            'users.*.name': [Unique(service)],
+        })
+
+        self.assertTrue(asyncio.run(v.passes_async(concurrency=3)))
+        self.assertEqual(10, service.calls)
+        self.assertEqual(3, service.max_running)
+
+    def test_sync_and_async_messages(self):
+        v = Validator({'name': 'jo'}, {'name': ['min:3', UniqueAsyncMessage(UsernameService({'jo'}))]})
+
+        self.assertFalse(asyncio.run(v.passes_async()))
+        self.assertEqual({'name': ['validation.min', 'jo is taken']}, v.failed_rules)
+        self.assertTrue(v.fails())
+
+    def test_required_stops_async_rule(self):
+        service = UsernameService(set())
+        v = Validator({}, {'name': ['required', Unique(service)]})
+
+        self.assertFalse(asyncio.run(v.passes_async()))
+        self.assertEqual(0, service.calls)
+
+    def test_passes_requires_async(self):
+        v = Validator({'name': 'john'}, {'name': [Unique(UsernameService(set()))]})
+
+        with self.assertRaises(ValueError):
+            v.passes()
+
+
+if __name__ == '__main__':
+    unittest.main()
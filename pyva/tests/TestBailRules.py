@@ -0,0 +1,89 @@
+import unittest
+from pyva import RuleContract, Validator
+from pyva.columnar import validate_columns
+
+
+class CountingRule(RuleContract):
+
+    def __init__(self):
+        self.calls = 0
+        self.messages = 0
+
+    def passes(self, attribute, value):
+        self.calls += 1
+        return False
+
+    def message(self, attribute, value):
+        self.messages += 1
+        return 'failed'
+
+
+class TestBailRules(unittest.TestCase):
+
+    def test_bail(self):
+        v = Validator({
+            'name': 'jo',
+            'email': 'jo',
+        }, {
+            'name': 'bail|string|min:3|email|max:1',
+            'email': 'string|min:3|email|max:1',
+        })
+
+        self.assertTrue(v.fails())
+        self.assertEqual(['validation.min'], v.failed_rules['name'])
+        self.assertEqual(['validation.min', 'validation.email', 'validation.max'], v.failed_rules['email'])
+
+    def test_bail_position_does_not_matter(self):
+        v = Validator({'name': 5}, {'name': ['string', 'min:6', 'bail']})
+
+        self.assertTrue(v.fails())
+        self.assertEqual({'name': ['validation.string']}, v.failed_rules)
+
+    def test_bail_with_wildcard(self):
+        v = Validator({'tags': ['a', 5, 'abc']}, {'tags.*': 'bail|string|min:2'})
+
+        self.assertTrue(v.fails())
+        self.assertEqual({'tags.0': ['validation.min'], 'tags.1': ['validation.string']}, v.failed_rules)
+
+    def test_bail_columnar(self):
+        result = validate_columns({'tags': ['a', 5, 'abc']}, {'tags': 'bail|string|min:2'})
+
+        self.assertEqual([1], list(result.get('tags', 'string').failed))
+        self.assertEqual([0], list(result.get('tags', 'min').failed))
+
+    def test_stop_on_first_failure(self):
+        rule = CountingRule()
+        v = Validator({
+            'name': 'jo',
+            'age': 10,
+        }, {
+            'name': 'string|min:3|max:1',
+            'age': ['integer', rule],
+        }, stop_on_first_failure=True)
+
+        self.assertTrue(v.fails())
+        self.assertEqual({'name': ['validation.min']}, v.failed_rules)
+        self.assertEqual(0, rule.calls)
+
+    def test_is_valid(self):
+        rule = CountingRule()
+        v = Validator({'name': 'John', 'age': 10}, {'name': 'string|min:3', 'age': ['integer', rule, 'min:18']})
+
+        self.assertFalse(v.is_valid())
+        self.assertEqual(1, rule.calls)
+        self.assertEqual(0, rule.messages)
+        self.assertEqual({}, v.failed_rules)
+
+        self.assertTrue(v.fails())
+        self.assertEqual({'age': ['failed', 'validation.min']}, v.failed_rules)
+
+    def test_is_valid_passes(self):
+        v = Validator({'users': [{'name': 'John'}, {'name': 'Anna'}]}, {'users.*.name': 'required|min:3'}, lazy=True)
+
+        self.assertTrue(v.is_valid())
+        self.assertTrue(v.passes())
+        self.assertFalse(Validator({'users': [{'name': 'Jo'}]}, {'users.*.name': 'required|min:3'}, lazy=True).is_valid())
+
+
+if __name__ == '__main__':
+    unittest.main()
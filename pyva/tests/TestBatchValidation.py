@@ -0,0 +1,86 @@
+import types
+import unittest
+from pyva import RuleContract, Schema, Validator
+
+
+class EndsWith(RuleContract):
+
+    def __init__(self, end_string):
+        self.end_string = end_string
+
+    def passes(self, attribute, value):
+        return value.endswith(self.end_string)
+
+
+class TestBatchValidation(unittest.TestCase):
+
+    rules = {
+        'name': 'required|string|min:3',
+        'tags.*': 'string',
+    }
+
+    records = [
+        {'name': 'John', 'tags': ['a', 'b']},
+        {'name': 'Jo', 'tags': ['a', 5]},
+        {'name': 'Anna'},
+        {'tags': [1]},
+    ]
+
+    def test_validate_many(self):
+        results = Validator.validate_many(self.records, self.rules)
+
+        self.assertEqual([True, False, True, False], [result.passed for result in results])
+        self.assertEqual([0, 1, 2, 3], [result.index for result in results])
+        self.assertIsNone(results[0].errors)
+        self.assertEqual({'name': ['validation.min'], 'tags.1': ['validation.string']}, results[1].errors)
+        self.assertEqual({'name': ['validation.required'], 'tags.0': ['validation.string']}, results[3].errors)
+
+    def test_results_match_single_validation(self):
+        for result, record in zip(Schema(self.rules).validate_many(self.records, lazy=True), self.records):
+            v = Validator(record, self.rules)
+            self.assertEqual(v.passes(), result.passed)
+            self.assertEqual(v.failed_rules if v.fails() else None, result.errors)
+
+    def test_iterator(self):
+        records = ({'name': 'user {}'.format(i) if i % 3 else ''} for i in range(9))
+        results = Validator.validate_many(records, self.rules, iterator=True)
+
+        self.assertIsInstance(results, types.GeneratorType)
+        self.assertEqual([0, 3, 6], [result.index for result in results if not result.passed])
+
+    def test_custom_messages(self):
+        results = Validator.validate_many([{}, {}], {'name': 'required'}, {'name.required': 'name is required'})
+
+        self.assertEqual([{'name': ['name is required']}] * 2, [result.errors for result in results])
+        self.assertIsNot(results[0].errors, results[1].errors)
+
+    def test_parallel(self):
+        records = [{'name': 'user {}'.format(i) if i % 7 else 'x', 'tags': ['a', i]} for i in range(50)]
+
+        serial = Validator.validate_many(records, self.rules)
+        parallel = Validator.validate_many(records, self.rules, parallel=2, chunk_size=8)
+
+        self.assertEqual(serial, parallel)
+
+    def test_parallel_iterator_with_rule_contract(self):
+        records = ({'company': 'Acme company' if i % 2 else 'Acme'} for i in range(20))
+        results = Schema({'company': ['required', EndsWith('company')]}).validate_many(
+            records, iterator=True, parallel=2, chunk_size=3
+        )
+
+        self.assertIsInstance(results, types.GeneratorType)
+        self.assertEqual(list(range(0, 20, 2)), [result.index for result in results if not result.passed])
+
+    def test_parallel_requires_picklable_rules(self):
+        with self.assertRaises(ValueError):
+            Validator.validate_many([{'name': 'John'}], {'name': [lambda attribute, value, fail: None]}, parallel=2)
+
+        # raised when validate_many() is called, not when the first result is requested
+        with self.assertRaises(ValueError):
+            Validator.validate_many(
+                [{'name': 'John'}], {'name': [lambda attribute, value, fail: None]}, iterator=True, parallel=2
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pyva import Schema
+from pyva.cli import main, validate_lines
+
+lines = [
+    '{"name": "John", "email": "john@example.com", "tags": ["a"]}\n',
+    '\n',
+    '{"name": "Jo", "email": "x", "tags": [1, "b"]}\n',
+    'not json\n',
+    '{"name": "Anna", "email": 5}\n',
+    '{"name": "Anna", "email": "anna@example.com"}\n',
+]
+
+rules = {'name': 'required|string|min:3', 'email': 'required|email', 'tags.*': 'string'}
+
+
+class TestCli(unittest.TestCase):
+
+    def test_validate_lines(self):
+        output = io.StringIO()
+        validated = io.StringIO()
+        summary = validate_lines(lines, Schema(rules), output, validated)
+
+        failures = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(failures[0], {
+            'line': 3,
+            'failed_rules': {'name': ['validation.min'], 'email': ['validation.email'], 'tags.0': ['validation.string']},
+        })
+        self.assertEqual([failure['line'] for failure in failures], [3, 4, 5])
+        self.assertTrue(failures[1]['error'].startswith('Invalid JSON'))
+        self.assertTrue(failures[2]['error'].startswith('TypeError'))
+
+        self.assertEqual(
+            [json.loads(line) for line in validated.getvalue().splitlines()],
+            [{'name': 'John', 'email': 'john@example.com', 'tags': ['a']}, {'name': 'Anna', 'email': 'anna@example.com'}]
+        )
+        self.assertEqual((summary['records'], summary['passed'], summary['failed']), (5, 2, 3))
+        self.assertEqual(summary['attributes'], {'name': 1, 'email': 1, 'tags.*': 1})
+
+    def test_bad_records_are_reported(self):
+        output = io.StringIO()
+        records = ['5\n', 'null\n', '{"age": true}\n', '{"users": 5}\n', '{"users": [{"name": "John"}], "age": 20}\n']
+        summary = validate_lines(records, Schema({'users.*.name': 'required|string', 'age': 'min:3'}), output)
+
+        failures = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([failure['line'] for failure in failures], [1, 2, 3, 4])
+        self.assertTrue(failures[0]['error'].startswith('Record must be JSON object'))
+        self.assertTrue(failures[1]['error'].startswith('Record must be JSON object'))
+        self.assertTrue(failures[2]['error'].startswith('ValueError'))
+        self.assertTrue(failures[3]['error'].startswith('TypeError'))
+        self.assertEqual((summary['records'], summary['passed'], summary['failed']), (5, 1, 4))
+
+    def test_max_errors(self):
+        output = io.StringIO()
+        summary = validate_lines(lines, Schema(rules), output, max_errors=2)
+
+        self.assertTrue(summary['stopped'])
+        self.assertEqual(summary['records'], 3)
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            rules_file = os.path.join(directory, 'rules.json')
+            input_file = os.path.join(directory, 'input.ndjson')
+            output_file = os.path.join(directory, 'failures.ndjson')
+            with open(rules_file, 'w') as file:
+                json.dump(rules, file)
+            with open(input_file, 'w') as file:
+                file.writelines(lines)
+
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                code = main(['validate', '--rules', rules_file, input_file, '-o', output_file])
+            self.assertEqual(code, 1)
+            self.assertIn('5 records, 2 passed, 3 failed', stderr.getvalue())
+            with open(output_file) as file:
+                self.assertEqual(len(file.readlines()), 3)
+
+            with open(input_file, 'w') as file:
+                file.write(lines[0])
+            stdout = io.StringIO()
+            with redirect_stderr(io.StringIO()), redirect_stdout(stdout):
+                self.assertEqual(main(['validate', '--rules', rules_file, input_file]), 0)
+            self.assertEqual(stdout.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import copy
+import random
+import unittest
+from pyva import Validator, Schema, RuleContract
+import pyva.codegen as codegen
+from pyva.validator import result_cache
+
+RULES = [
+    'required', 'nullable', 'bail', 'string', 'integer', 'numeric', 'list', 'dict', 'email', 'url', 'ip', 'ipv4',
+    'ipv6', 'date', 'present', 'min:3', 'max:20', 'between:2,30', 'size:5', 'in:a,abc,5', 're:^a', 'min:2.5',
+    'between:a,3', 'size:x', 'max:3,x', 'in', 'min', 're:5', 'required_with:{other}', 'required_without:{other}',
+    'required_if:{other},5', 'required_unless:{other},abc', 'gt:{other}', 'lte:{other}', 'required_with:{pattern}',
+]
+
+VALUES = [
+    None, '', 'a', 'abc', 'x' * 25, 0, 1, 5, 25, -3, 2.5, '5', '5.6', True, False, [], [1, 2], {}, {'a': 1},
+    'email@example.com', 'http://example.com', '127.0.0.1', '::1', '2020-01-01', 'foo bar',
+]
+
+
+class Upper(RuleContract):
+
+    def passes(self, attribute, value):
+        return isinstance(value, str) and value.isupper()
+
+
+def no_spaces(attribute, value, fail):
+    if isinstance(value, str) and ' ' in value:
+        fail('{} must not contain spaces'.format(attribute))
+
+
+class EmailValidator(Validator):
+
+    def _validate_email(self, attribute, value):
+        return isinstance(value, str) and value.endswith('@example.com')
+
+
+class TestCodegen(unittest.TestCase):
+
+    def outcome(self, validator_class, data, schema, **options):
+        try:
+            v = validator_class(copy.deepcopy(data), schema, **options)
+            passed = v.passes()
+            return passed, list(v.failed_rules.items()), v.validated() if passed else None
+        except Exception as e:
+            return type(e), str(e)
+
+    def assertSameResult(self, data, rules, validator_class=Validator, **options):
+        schema = Schema(rules)
+        self.assertEqual(
+            self.outcome(validator_class, data, schema, **options),
+            self.outcome(validator_class, data, schema.generated(), **options),
+            (data, rules, options)
+        )
+
+    def test_generated_code_gives_the_same_result(self):
+        generator = random.Random(21)
+
+        def value(depth=0):
+            if depth < 2 and generator.random() < 0.3:
+                return {key: value(depth + 1) for key in generator.sample('abcd', generator.randint(0, 4))}
+            if depth < 2 and generator.random() < 0.15:
+                return [value(depth + 1) for _ in range(generator.randint(0, 3))]
+            return copy.deepcopy(generator.choice(VALUES))
+
+        for _ in range(600):
+            data = {key: value() for key in generator.sample('abcd', generator.randint(0, 4))}
+            rules = {}
+            for _ in range(generator.randint(1, 4)):
+                attribute = '.'.join([generator.choice('abcd')] + [
+                    generator.choice(['*', 'a', 'b', '0']) for _ in range(generator.randint(0, 2))
+                ])
+                rules[attribute] = '|'.join(
+                    generator.choice(RULES).format(
+                        other=generator.choice('abcd') + generator.choice(['', '.a', '.0']),
+                        pattern=attribute,
+                    )
+                    for _ in range(generator.randint(1, 4))
+                )
+
+            self.assertSameResult(data, rules)
+            self.assertSameResult(data, rules, stop_on_first_failure=True)
+            self.assertSameResult(data, rules, lazy=True)
+
+    def test_custom_rules_and_list_params(self):
+        rules = {
+            'name': ['required', Upper(), no_spaces, ['in', 'JOHN', None], ['between', '2', 8]],
+            'tags.*': ['string', ['min', 2], no_spaces],
+        }
+        for data in [{'name': 'JOHN', 'tags': ['ab']}, {'name': 'jo hn', 'tags': ['a b', 5]}, {}]:
+            self.assertSameResult(data, rules)
+
+    def test_overridden_rule_is_called(self):
+        rules = {'email': 'required|email'}
+        for email in ['john@example.com', 'john@gmail.com']:
+            self.assertSameResult({'email': email}, rules, EmailValidator)
+
+        self.assertIn('v._validate_email(attribute, value)', codegen.generate(Schema(rules), EmailValidator))
+        self.assertIn('_email(value)', codegen.generate(Schema(rules), Validator))
+
+    def test_is_valid(self):
+        schema = Schema({'name': 'required|string|min:3', 'age': 'integer|min:18'})
+        for data in [{'name': 'John', 'age': 20}, {'name': 'Jo', 'age': 20}, {'name': 'John', 'age': 'x'}]:
+            self.assertEqual(Validator(data, schema).is_valid(), Validator(data, schema.generated()).is_valid())
+
+    def test_pure_rules_use_result_cache(self):
+        rules = {'email': 'email', 'code': 're:^a', 'day': 'date|string'}
+        data = {'email': 'john@example.com', 'code': 'abc', 'day': 'x'}
+        result_cache.clear()
+        result_cache.maxsize = 100
+        try:
+            Validator(data, Schema(rules)).passes()
+            interpreted = len(result_cache)
+            v = Validator(data, Schema(rules).generated())
+            self.assertFalse(v.passes())
+            self.assertEqual(v.failed_rules, {'day': ['validation.date']})
+            self.assertEqual(len(result_cache), interpreted)
+            self.assertEqual(result_cache.info()['hits'], 3)
+        finally:
+            result_cache.clear()
+            result_cache.maxsize = 0
+
+    def test_code_is_generated_once(self):
+        schema = Schema({'name': 'required|string'}).generated()
+        self.assertIs(codegen.checks(schema, Validator), codegen.checks(schema, Validator))
+        self.assertFalse(Schema({'name': 'required'}).codegen)
+
+
+if __name__ == '__main__':
+    unittest.main()
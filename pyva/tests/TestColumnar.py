@@ -0,0 +1,84 @@
+import unittest
+from pyva import Validator
+from pyva.columnar import validate_columns, np
+
+
+class TestColumnar(unittest.TestCase):
+
+    columns = {
+        'age': [20, 15, 30, 45],
+        'limit': [25, 10, 20, 50],
+        'name': ['John', 'Jo', None, 'Anna'],
+        'country': ['am', 'us', 'fr', 'xx'],
+    }
+
+    rules = {
+        'age': 'required|integer|between:18,40|lt:limit',
+        'name': 'required|string|min:3',
+        'country': 'in:am,us,fr',
+    }
+
+    def row_failures(self, columns, rules):
+        rows = len(next(iter(columns.values())))
+        return [
+            index for index in range(rows)
+            if Validator({name: column[index] for name, column in columns.items()}, rules).fails()
+        ]
+
+    def test_lists(self):
+        result = validate_columns(self.columns, self.rules)
+
+        self.assertTrue(result.fails())
+        self.assertEqual(self.row_failures(self.columns, self.rules), result.failed_rows())
+        self.assertEqual([1, 3], list(result.get('age', 'between').failed))
+        self.assertEqual([1, 2], list(result.get('age', 'lt').failed))
+        self.assertEqual([2], list(result.get('name', 'required').failed))
+        self.assertEqual([1], list(result.get('name', 'min').failed))
+        self.assertEqual([3], list(result.get('country', 'in').failed))
+
+    def test_required_stops_row(self):
+        result = validate_columns({'name': [None, 'a']}, {'name': 'required|string|min:3'})
+
+        self.assertEqual([0], list(result.get('name', 'required').failed))
+        self.assertEqual([1], list(result.get('name', 'min').failed))
+
+    def test_custom_rules_fall_back_to_rows(self):
+        def is_odd(attribute, value, fail):
+            if value % 2 != 1:
+                fail('{} must be odd'.format(attribute))
+
+        result = validate_columns({'number': [1, 2, 3, 4]}, {'number': ['integer', is_odd]})
+
+        self.assertEqual([1, 3], list(result.get('number', is_odd).failed))
+        self.assertEqual([1, 3], result.failed_rows())
+
+    def test_different_lengths(self):
+        with self.assertRaises(ValueError):
+            validate_columns({'a': [1, 2], 'b': [1]}, {'a': 'integer'})
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_numpy_arrays(self):
+        columns = {
+            'age': np.array([20, 15, 30, 45]),
+            'limit': np.array([25.0, 10.0, 20.0, 50.0]),
+            'score': np.array([0.5, 7.5, 3.0, 10.0]),
+            'country': np.array(['am', 'us', 'fr', 'xx']),
+        }
+        rules = {
+            'age': 'integer|between:18,40|lt:limit',
+            'score': 'numeric|integer|max:9|in:0.5,7.5',
+            'country': 'in:am,us,fr',
+        }
+
+        result = validate_columns(columns, rules)
+
+        self.assertIsInstance(result.get('age', 'between').mask, np.ndarray)
+        self.assertEqual(self.row_failures(columns, rules), result.failed_rows())
+        self.assertEqual([0, 1, 2, 3], list(result.get('score', 'integer').failed))
+        self.assertEqual([2, 3], list(result.get('score', 'in').failed))
+        self.assertEqual([3], list(result.get('score', 'max').failed))
+        self.assertEqual([False, True, True, True], list(result.get('country', 'in').mask[::-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
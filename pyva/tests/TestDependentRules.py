@@ -234,3 +234,24 @@ class TestDependentRules(unittest.TestCase):
 
         self.assertTrue(v.fails())
         self.assertTrue('user.age' in v.failed_rules)
+
+    def test_other_fields_are_resolved_once(self):
+        data = {
+            'a': None,
+            'b': 'x',
+            'items': [{'name': 'item'} for _ in range(100)],
+        }
+        v = Validator(data, {
+            'items.*.name': 'required_with:a,b,c|required_without_all:a,b',
+        })
+
+        self.assertTrue(v.passes())
+        self.assertEqual(v.resolution_info(), {'hits': 398, 'misses': 2, 'size': 2})
+
+    def test_other_fields_in_lazy_mode(self):
+        data = {'items': [{'name': 'item', 'code': None if i % 2 else 'c'} for i in range(3000)]}
+        v = Validator(data, {'items.*.name': 'required', 'items.*.code': 'required_with:items.*.name'}, lazy=True)
+
+        self.assertTrue(v.fails())
+        self.assertEqual(len(v.failed_rules), 1500)
+        self.assertLessEqual(v.resolution_info()['size'], Validator._lazy_resolved_size)
@@ -1,5 +1,7 @@
+import random
 import unittest
 from pyva import Validator
+import pyva.regexes as regexes
 
 
 class MyTestCase(unittest.TestCase):
@@ -74,3 +76,30 @@ class MyTestCase(unittest.TestCase):
                 }
             )
             self.assertTrue(v.fails())
+
+    def test_email_precheck_keeps_pattern_result(self):
+        pattern = regexes.builtin('email')
+        emails = [
+            'a' * 64 + '@example.com',
+            'a' * 65 + '@example.com',
+            'email@' + 'b' * 63 + '.com',
+            'email@' + 'b' * 64 + '.com',
+            'x' * 240 + '@example.com',
+            'email@example.com\n',
+            '"a@b"@example.com',
+            '"a\\"b"@example.com',
+            'email@[IPv6:::1]',
+            'email@',
+            '',
+        ]
+
+        parts = ['a', 'x' * 63, 'y' * 64, '.', '@', '"', '\\', '[', ']', 'IPv6:', '1.2.3.4', '-', '\n', ' ', 'com']
+        generator = random.Random(13)
+        for _ in range(20000):
+            emails.append(''.join(generator.choice(parts) for _ in range(generator.randint(0, 10))))
+
+        for email in emails:
+            if not regexes.plausible_email(email):
+                self.assertIsNone(pattern.search(email), email)
+            v = Validator({'email': email}, {'email': 'email'})
+            self.assertEqual(v.passes(), pattern.search(email) is not None, email)
@@ -0,0 +1,148 @@
+import enum
+import re
+import sys
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Number
+from pyva import helpers
+
+
+# numeric helpers as they were before the type dispatch, the new ones must give the same results
+def old_is_int(value):
+    return True if re.match(r'[-+]?\d+$', str(value)) is not None else False
+
+
+def old_is_float(num):
+    return isinstance(num, float) or (
+            isinstance(num, str) and num.find('.') > 0 and old_is_int(num.replace('.', '', 1))
+    )
+
+
+def old_is_numeric(value):
+    return True if isinstance(value, Number) or \
+                   (isinstance(value, str) and value.isnumeric()) or \
+                   old_is_float(value) else False
+
+
+def old_to_numeric(num):
+    if old_is_int(num):
+        return int(num)
+    elif old_is_float(num):
+        return float(num)
+    raise ValueError('Invalid number provided')
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class Text(str):
+    def __str__(self):
+        return '5'
+
+
+class Integer(int):
+    def __str__(self):
+        return 'five'
+
+
+VALUES = [
+    0, 5, -5, 10 ** 20, -10 ** 20, 10 ** 599, 10 ** 600, -10 ** 600, 10 ** 5000, True, False, None,
+    0.0, -0.0, 5.0, 5.5, 1e16, 1e-7, float('inf'), float('-inf'), float('nan'), 1 + 2j,
+    Decimal('5'), Decimal('5.0'), Decimal('-1'), Fraction(5, 1), Fraction(1, 2), Color.RED, Text('x'), Integer(5),
+    b'5', [5], (5,), {}, {5}, object(),
+]
+
+STRINGS = [
+    '', ' ', '\n', '5', '-5', '+5', '05', '5\n', '5\n\n', '\n5', ' 5', '5 ', '-', '+', '+-5', '--5', '-5\n', '1_000',
+    '0x1f', '1e5', '1E5', 'inf', 'nan', 'True', '5.6', '-5.6', '+5.6', '.5', '-.5', '5.', '5..6', '1.2.3', '5.6\n',
+    '.', '-.', '5.-6', '5.6.', 'a.5', '5.a', '\u0663', '-\u0663', '\u0663.\u0663', '\u00b2', '\u00bd', '\u216b',
+    '\uff15', '\U0001d7ce', '\u0663\n',
+]
+
+
+class TestHelpers(unittest.TestCase):
+
+    data = {
+        'user': {
+            'name': 'John',
+            'age': None,
+            'children': [
+                {'name': 'jr1'},
+                {'name': 'jr2'},
+            ],
+        },
+        'user.nickname': 'Johnny',
+        'tags': ('a', 'b'),
+    }
+
+    def test_compile_path(self):
+        self.assertEqual(('user',), helpers.compile_path('user'))
+        self.assertEqual(('user', 'children', 1, 'name'), helpers.compile_path('user.children.1.name'))
+        self.assertEqual(('items', -1), helpers.compile_path('items.-1'))
+
+    def test_resolve_path(self):
+        self.assertEqual((True, 'jr2'), helpers.resolve_path(('user', 'children', 1, 'name'), self.data))
+        self.assertEqual((True, None), helpers.resolve_path(('user', 'age'), self.data))
+        self.assertEqual((False, None), helpers.resolve_path(('user', 'wife'), self.data))
+        self.assertEqual((False, None), helpers.resolve_path(('user', 'children', 2), self.data))
+        self.assertEqual((False, None), helpers.resolve_path(('user', 'children', 'name'), self.data))
+        self.assertEqual((False, None), helpers.resolve_path(('user', 'name', 'first'), self.data))
+
+    def test_data_lookup(self):
+        self.assertEqual((True, 'Johnny'), helpers.data_lookup('user.nickname', self.data))
+        self.assertEqual((True, 'b'), helpers.data_lookup('tags.1', self.data))
+        self.assertEqual((False, None), helpers.data_lookup(5, self.data))
+
+    def test_data_get(self):
+        self.assertEqual('jr1', helpers.data_get('user.children.0.name', self.data))
+        self.assertEqual('default', helpers.data_get('user.wife', self.data, 'default'))
+        self.assertIsNone(helpers.data_get('user.age', self.data, 'default'))
+
+    def test_data_has(self):
+        self.assertTrue(helpers.data_has('user.age', self.data))
+        self.assertTrue(helpers.data_has('user.nickname', self.data))
+        self.assertFalse(helpers.data_has('user.wife', self.data))
+        self.assertFalse(helpers.data_has('user.children.5', self.data))
+
+    def test_lookup_does_not_copy_data(self):
+        class NoCopy(dict):
+            def copy(self):
+                raise AssertionError('data must not be copied')
+
+        self.assertEqual('John', helpers.data_get('user.name', NoCopy(self.data)))
+        self.assertTrue(helpers.data_has('user.name', NoCopy(self.data)))
+
+    def assertSameNumeric(self, value):
+        for new, old in [
+            (helpers.is_int, old_is_int), (helpers.is_float, old_is_float), (helpers.is_numeric, old_is_numeric),
+            (helpers.to_numeric, old_to_numeric),
+        ]:
+            try:
+                expected = old(value)
+            except ValueError as e:
+                with self.assertRaises(ValueError, msg=(new.__name__, value)):
+                    new(value)
+                continue
+            result = new(value)
+            self.assertEqual((type(result), repr(result)), (type(expected), repr(expected)), (new.__name__, value))
+
+    def test_numeric_helpers_are_the_same_as_regex_ones(self):
+        for value in VALUES + STRINGS:
+            self.assertSameNumeric(value)
+
+    def test_numeric_helpers_for_every_numeric_character(self):
+        characters = [chr(code) for code in range(sys.maxunicode + 1)]
+        # \d of re is the Unicode decimal digit, the same characters as str.isdecimal()
+        self.assertEqual(re.findall(r'\d', ''.join(characters)), [c for c in characters if c.isdecimal()])
+
+        numeric = [c for c in characters if c.isnumeric() or c.isdecimal()] + [chr(code) for code in range(128)]
+        for character in numeric:
+            for value in (character, '-' + character, '5' + character, character + '\n', '5.' + character,
+                          character + '.5', '.' + character):
+                self.assertSameNumeric(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from pyva import Validator, Schema, RuleContract
+from pyva.hooks import ValidationHook, RuleMetrics
+
+
+class Upper(RuleContract):
+
+    def passes(self, attribute, value):
+        return value.isupper()
+
+
+def starts_with_a(attribute, value, fail):
+    if not value.startswith('a'):
+        fail('must start with a')
+
+
+class RecordingHook(ValidationHook):
+
+    def __init__(self):
+        self.calls = []
+
+    def before_rule(self, validator, attribute, pattern, rule):
+        self.calls.append(('before', attribute, pattern, rule))
+
+    def after_rule(self, validator, attribute, pattern, rule, passed, elapsed):
+        self.calls.append(('after', attribute, pattern, rule, passed))
+
+
+class TestHooks(unittest.TestCase):
+
+    def test_hooks_are_called_around_every_rule(self):
+        hook = RecordingHook()
+        v = Validator({'users': [{'email': 'a@example.com'}, {'email': 'b'}]}, {'users.*.email': 'required|email'}, hooks=[hook])
+
+        self.assertTrue(v.fails())
+        self.assertEqual(hook.calls, [
+            ('before', 'users.0.email', 'users.*.email', 'required'),
+            ('after', 'users.0.email', 'users.*.email', 'required', True),
+            ('before', 'users.0.email', 'users.*.email', 'email'),
+            ('after', 'users.0.email', 'users.*.email', 'email', True),
+            ('before', 'users.1.email', 'users.*.email', 'required'),
+            ('after', 'users.1.email', 'users.*.email', 'required', True),
+            ('before', 'users.1.email', 'users.*.email', 'email'),
+            ('after', 'users.1.email', 'users.*.email', 'email', False),
+        ])
+
+    def test_rule_which_raises_is_reported_as_failed(self):
+        hook = RecordingHook()
+        with self.assertRaises(TypeError):
+            Validator({'email': 5}, {'email': 'email'}, hooks=[hook]).passes()
+
+        self.assertEqual(hook.calls[-1], ('after', 'email', 'email', 'email', False))
+
+    def test_rule_metrics(self):
+        metrics = RuleMetrics()
+        upper = Upper()
+        schema = Schema({'users.*.name': ['string', upper, starts_with_a], 'email': 'email'})
+        records = [
+            {'users': [{'name': 'ABC'}, {'name': 'abc'}], 'email': 'a@example.com'},
+            {'users': [{'name': 'X'}], 'email': 'b'},
+        ]
+        schema.validate_many(records, hooks=[metrics])
+
+        exported = metrics.as_dict()
+        counters = {
+            name: (rule['calls'], rule['failures']) for name, rule in exported['rules'].items()
+        }
+        self.assertEqual(counters, {'string': (3, 0), 'Upper': (3, 1), 'starts_with_a': (3, 2), 'email': (2, 1)})
+        self.assertEqual(set(exported['patterns']), {'users.*.name', 'email'})
+        self.assertEqual(exported['patterns']['users.*.name']['Upper']['calls'], 3)
+        self.assertGreaterEqual(exported['rules']['email']['time'], 0)
+
+        metrics.clear()
+        self.assertEqual(metrics.as_dict(), {'rules': {}, 'patterns': {}})
+
+    def test_hooks_are_not_supported_with_parallel(self):
+        with self.assertRaises(ValueError):
+            Validator.validate_many([{}], {'name': 'string'}, parallel=2, hooks=[RuleMetrics()])
+
+
+if __name__ == '__main__':
+    unittest.main()
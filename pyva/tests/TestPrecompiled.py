@@ -0,0 +1,110 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pyva
+import pyva.codegen as codegen
+from pyva import Validator, Schema, RuleContract
+from pyva.cli import main
+from pyva.precompiled import compile_rules
+
+RULES = {
+    'name': 'required|string|min:3',
+    'age': 'nullable|integer|between:18,99',
+    'email': 'required_with:name|email',
+    'tags': ['list', ['max', 3]],
+    'tags.*': 'string|in:a,b,c',
+    'users.*.family.*.child': 'required|re:^[A-Z]',
+    'total': 'gte:items.*.price',
+}
+
+MESSAGES = {'name.min': 'name is too short'}
+
+DATA = [
+    {},
+    {'name': 'John', 'age': 25, 'email': 'john@example.com', 'tags': ['a'], 'total': 5},
+    {'name': 'Jo', 'age': '17', 'email': 'john', 'tags': ['a', 'd', 5, 'b'], 'items': [{'price': 6}], 'total': 5},
+    {'users': [{'family': [{'child': 'Ann'}, {'child': 'bob'}]}, {'family': []}]},
+]
+
+
+class Upper(RuleContract):
+
+    def passes(self, attribute, value):
+        return isinstance(value, str) and value.isupper()
+
+
+def no_spaces(attribute, value, fail):
+    if isinstance(value, str) and ' ' in value:
+        fail('{} must not contain spaces'.format(attribute))
+
+
+CUSTOM_RULES = {'code': ['required', Upper(), no_spaces, ['in', 'AB', 'A B', None]]}
+
+
+class TestPrecompiled(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self, source, name='compiled_rules'):
+        path = os.path.join(self.directory.name, name + '.py')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(source)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def outcome(self, data, schema):
+        v = Validator(data, schema)
+        passed = v.passes()
+        return passed, v.failed_rules, v.validated() if passed else None
+
+    def test_compiled_schema_gives_the_same_result(self):
+        schema = self.load(compile_rules(RULES, MESSAGES)).SCHEMA
+        self.assertEqual(schema.initial_rules, RULES)
+        self.assertEqual(schema.messages, MESSAGES)
+        self.assertEqual(list(schema.attributes), list(RULES))
+        for data in DATA:
+            self.assertEqual(self.outcome(data, schema), self.outcome(data, Schema(RULES, MESSAGES)))
+
+    def test_import_does_not_parse_rules(self):
+        source = compile_rules(RULES)
+        with mock.patch.object(Schema, 'compile', side_effect=AssertionError), \
+                mock.patch.object(codegen, 'generate', side_effect=AssertionError):
+            schema = self.load(source).SCHEMA
+            self.assertFalse(Validator(DATA[2], schema).passes())
+
+    def test_stale_module_is_refused(self):
+        source = compile_rules(RULES)
+        stale = source.replace(repr(pyva.__version__), repr('0.0.1'), 1)
+        self.assertNotEqual(source, stale)
+        with self.assertRaises(ValueError):
+            self.load(stale)
+
+    def test_custom_rules_are_imported_from_source(self):
+        with self.assertRaises(ValueError):
+            compile_rules(CUSTOM_RULES)
+
+        source = compile_rules(CUSTOM_RULES, rules_source=__name__ + ':CUSTOM_RULES')
+        schema = self.load(source).SCHEMA
+        self.assertIs(schema.attributes['code'].rules[1].rule, CUSTOM_RULES['code'][1])
+        for code in ['AB', 'A B', 'ab', None]:
+            self.assertEqual(self.outcome({'code': code}, schema), self.outcome({'code': code}, Schema(CUSTOM_RULES)))
+
+    def test_compile_command(self):
+        output = os.path.join(self.directory.name, 'cli_rules.py')
+        self.assertEqual(main(['compile', __name__ + ':RULES', '--messages', __name__ + ':MESSAGES', '-o', output]), 0)
+
+        with open(output, encoding='utf-8') as file:
+            schema = self.load(file.read(), 'cli_rules').SCHEMA
+        self.assertEqual(self.outcome(DATA[2], schema), self.outcome(DATA[2], Schema(RULES, MESSAGES)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import re
+import unittest
+from pyva import Validator
+import pyva.regexes as regexes
+
+
+class TestRegexRules(unittest.TestCase):
+    def test_builtin_patterns_are_compiled_once(self):
+        self.assertIs(regexes.builtin('email'), regexes.builtin('email'))
+        self.assertTrue(Validator({'ip': '127.0.0.1'}, {'ip': 'ipv4'}).passes())
+
+        compiled = regexes.builtin('ipv4')
+        re.purge()
+        self.assertIs(regexes.builtin('ipv4'), compiled)
+
+    def test_re_rule_survives_re_purge(self):
+        regexes.pattern_cache.clear()
+
+        self.assertTrue(Validator({'code': 'ab-12'}, {'code': 're:^[a-z]+-[0-9]+$'}).passes())
+        compiled = regexes.user_pattern('^[a-z]+-[0-9]+$')
+
+        re.purge()
+        self.assertFalse(Validator({'code': 'ab12'}, {'code': 're:^[a-z]+-[0-9]+$'}).passes())
+        self.assertIs(regexes.user_pattern('^[a-z]+-[0-9]+$'), compiled)
+        self.assertEqual(regexes.pattern_cache.info()['misses'], 1)
+
+    def test_pattern_cache_is_bounded(self):
+        maxsize = regexes.pattern_cache.maxsize
+        regexes.pattern_cache.clear()
+        regexes.pattern_cache.maxsize = 2
+        try:
+            for pattern in ('^a', '^b', '^c'):
+                Validator({'value': 'abc'}, {'value': 're:' + pattern}).passes()
+
+            self.assertEqual(len(regexes.pattern_cache), 2)
+            self.assertNotIn('^a', regexes.pattern_cache)
+            self.assertIn('^c', regexes.pattern_cache)
+        finally:
+            regexes.pattern_cache.maxsize = maxsize
+            regexes.pattern_cache.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
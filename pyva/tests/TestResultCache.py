@@ -0,0 +1,94 @@
+import unittest
+from pyva import Validator, RuleContract
+from pyva.validator import result_cache
+
+
+class CountingUpper(RuleContract):
+    pure = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def passes(self, attribute, value):
+        self.calls += 1
+        return value.isupper()
+
+
+class CountingEmailValidator(Validator):
+    calls = 0
+
+    def _validate_email(self, attribute, value):
+        CountingEmailValidator.calls += 1
+        return super()._validate_email(attribute, value)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        result_cache.clear()
+        result_cache.maxsize = 100
+        CountingEmailValidator.calls = 0
+
+    def tearDown(self):
+        result_cache.clear()
+        result_cache.maxsize = 0
+
+    def test_cache_is_disabled_by_default(self):
+        result_cache.maxsize = 0
+        for _ in range(3):
+            CountingEmailValidator({'email': 'john@example.com'}, {'email': 'email'}).passes()
+
+        self.assertEqual(CountingEmailValidator.calls, 3)
+        self.assertEqual(len(result_cache), 0)
+
+    def test_pure_rule_is_checked_once_per_value(self):
+        records = [{'email': email} for email in ['john@example.com', 'bad', 'john@example.com', 'bad']]
+        results = CountingEmailValidator.validate_many(records, {'email': 'email'})
+
+        self.assertEqual([result.passed for result in results], [True, False, True, False])
+        self.assertEqual(results[3].errors, {'email': ['validation.email']})
+        self.assertEqual(CountingEmailValidator.calls, 2)
+        self.assertEqual(result_cache.info()['hits'], 2)
+        self.assertEqual(result_cache.info()['hit_rate'], 0.5)
+
+    def test_params_and_value_type_are_part_of_the_key(self):
+        self.assertTrue(Validator({'code': 'ab'}, {'code': 're:^a'}).passes())
+        self.assertFalse(Validator({'code': 'ab'}, {'code': 're:^b'}).passes())
+
+        rule = CountingUpper()
+        rule.passes = lambda attribute, value: type(value) is int
+        self.assertTrue(Validator({'count': 1}, {'count': [rule]}).passes())
+        self.assertFalse(Validator({'count': True}, {'count': [rule]}).passes())
+        self.assertFalse(Validator({'count': 1.0}, {'count': [rule]}).passes())
+        self.assertEqual(len(result_cache), 5)
+
+    def test_subclass_does_not_share_results(self):
+        Validator({'email': 'john@example.com'}, {'email': 'email'}).passes()
+        CountingEmailValidator({'email': 'john@example.com'}, {'email': 'email'}).passes()
+
+        self.assertEqual(CountingEmailValidator.calls, 1)
+
+    def test_unhashable_value_is_not_cached(self):
+        rule = CountingUpper()
+        rule.passes = lambda attribute, value: True
+        self.assertTrue(Validator({'names': ['A']}, {'names': [rule]}).passes())
+        self.assertEqual(len(result_cache), 0)
+
+    def test_pure_rule_contract(self):
+        rule = CountingUpper()
+        records = [{'code': code} for code in ['AB', 'ab', 'AB', 'ab', 'AB']]
+        results = Validator.validate_many(records, {'code': [rule]})
+
+        self.assertEqual([result.passed for result in results], [True, False, True, False, True])
+        self.assertEqual(results[1].errors, {'code': ['validation.CountingUpper']})
+        self.assertEqual(rule.calls, 2)
+
+    def test_not_pure_rule_contract_is_always_called(self):
+        rule = CountingUpper()
+        rule.pure = False
+        Validator.validate_many([{'code': 'AB'}] * 3, {'code': [rule]})
+
+        self.assertEqual(rule.calls, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from pyva import Validator
+from pyva.hooks import ValidationHook
+
+
+class ValidatedAttributes(ValidationHook):
+
+    def __init__(self):
+        self.attributes = set()
+
+    def after_rule(self, validator, attribute, pattern, rule, passed, elapsed):
+        self.attributes.add(attribute)
+
+
+class TestRevalidation(unittest.TestCase):
+
+    def test_update_changes_failed_rules_in_place(self):
+        v = Validator({'name': 'John', 'age': 15}, {'name': 'required|min:3', 'age': 'required|min:18'})
+        self.assertTrue(v.fails())
+        failed_rules = v.failed_rules
+
+        self.assertTrue(v.update('age', 20))
+        self.assertIs(v.failed_rules, failed_rules)
+        self.assertEqual(failed_rules, {})
+
+        self.assertFalse(v.update('name', 'Jo'))
+        self.assertEqual(failed_rules, {'name': ['validation.min']})
+        self.assertEqual(v.data, {'name': 'Jo', 'age': 20})
+
+    def test_only_affected_attributes_are_validated(self):
+        hook = ValidatedAttributes()
+        rules = {'field{}'.format(i): 'required|string' for i in range(300)}
+        rules['email'] = 'required_with:field1|email'
+        rules['user'] = 'required|dict'
+        rules['user.name'] = 'required|string'
+        data = {'field{}'.format(i): 'value' for i in range(300)}
+        data.update({'email': 'john@example.com', 'user': {'name': 'John'}})
+
+        v = Validator(data, rules, hooks=[hook])
+        self.assertTrue(v.passes())
+
+        hook.attributes.clear()
+        self.assertFalse(v.update('field1', None))
+        self.assertEqual(hook.attributes, {'field1', 'email'})
+
+        hook.attributes.clear()
+        self.assertFalse(v.update('user.name', 'Jo'))
+        self.assertEqual(hook.attributes, {'user', 'user.name'})
+
+    def test_wildcard_dependent_rules(self):
+        hook = ValidatedAttributes()
+        data = {'items': [{'name': 'a', 'code': 'x'}, {'name': None, 'code': None}, {'name': 'c', 'code': 'z'}]}
+        v = Validator(data, {'items.*.code': 'required_with:items.*.name', 'total': 'gte:items.0.code'}, hooks=[hook])
+        self.assertTrue(v.passes())
+
+        hook.attributes.clear()
+        self.assertFalse(v.update('items.1.name', 'b'))
+        self.assertEqual(hook.attributes, {'items.1.code'})
+        self.assertEqual(v.failed_rules, {'items.1.code': ['validation.required_with']})
+
+        self.assertTrue(v.update('items.1.code', 'y'))
+
+    def test_new_list_items_are_expanded(self):
+        v = Validator({'items': [{'name': 'a'}]}, {'items.*.name': 'required|min:2'})
+        self.assertTrue(v.fails())
+
+        self.assertFalse(v.update('items.2', {'name': 'cc'}))
+        self.assertEqual(v.failed_rules, {'items.0.name': ['validation.min'], 'items.1.name': ['validation.required']})
+
+        self.assertTrue(v.update('items', [{'name': 'aa'}]))
+        self.assertEqual(v.failed_rules, {})
+
+    def test_revalidate_after_data_was_changed(self):
+        data = {'password': 'secret', 'password_repeat': 'secret'}
+        v = Validator(data, {'password_repeat': 'required_with:password'})
+        self.assertTrue(v.passes())
+
+        del data['password_repeat']
+        self.assertFalse(v.revalidate(['password_repeat']))
+
+    def test_lazy_validator_can_not_be_updated(self):
+        v = Validator({'items': [1]}, {'items.*': 'integer'}, lazy=True)
+        v.passes()
+        with self.assertRaises(ValueError):
+            v.update('items.0', 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from pyva import Validator, Schema, RuleContract
+from pyva.ruleStatistics import RuleStatistics
+
+
+class Upper(RuleContract):
+
+    def passes(self, attribute, value):
+        return value.isupper()
+
+
+class TestRuleOrdering(unittest.TestCase):
+
+    def test_cheap_rules_run_first(self):
+        schema = Schema({'name': 're:^a|email|string'}).optimized()
+
+        self.assertEqual(schema.attributes['name'].names, ('string', 're', 'email'))
+
+    def test_fixed_rules_keep_position(self):
+        upper = Upper()
+        schema = Schema({'name': ['email', 'min:3', 'required', upper, 'date', 'string', 'nullable', 'max:5']})
+        optimized = schema.optimized()
+
+        self.assertEqual(
+            optimized.attributes['name'].names,
+            ('min', 'email', 'required', 'string', 'date', upper, 'nullable', 'max')
+        )
+        # original schema is not changed
+        self.assertEqual(schema.attributes['name'].names[:2], ('email', 'min'))
+
+    def test_type_rules_run_before_value_rules(self):
+        statistics = RuleStatistics()
+        schema = Schema({'email': 'bail|string|email'})
+        for email in ['john@example.com', 'john', 'jo@', 'anna@example.com']:
+            schema.validate({'email': email}, statistics=statistics)
+        optimized = schema.optimized(statistics)
+
+        self.assertEqual(optimized.attributes['email'].names, ('bail', 'string', 'email'))
+        self.assertFalse(Validator({'email': 5}, optimized).is_valid())
+        v = Validator({'email': 5}, optimized)
+        self.assertFalse(v.passes())
+        self.assertEqual(v.failed_rules, {'email': ['validation.string']})
+
+    def test_statistics_are_collected_per_pattern(self):
+        statistics = RuleStatistics()
+        schema = Schema({'items.*.name': 'string|max:3'})
+        schema.validate({'items': [{'name': 'ab'}, {'name': 'abcd'}, {'name': 'abcde'}, {'name': 'a'}]}, statistics=statistics)
+
+        self.assertEqual(statistics.runs[('items.*.name', 'string')], 4)
+        self.assertEqual(statistics.failure_rate('items.*.name', 'max'), 0.5)
+        self.assertEqual(statistics.failure_rate('items.*.name', 'string'), 0.0)
+        self.assertIsNone(statistics.failure_rate('items.*.name', 'email'))
+
+    def test_rules_which_fail_often_run_first(self):
+        statistics = RuleStatistics()
+        schema = Schema({'code': 'bail|string|in:a,b|email'})
+        for code in ['x@example.com', 'y@example.com', 'a', 'z@example.com']:
+            Validator({'code': code}, schema, statistics=statistics).passes()
+
+        optimized = schema.optimized(statistics)
+        # string never fails, but it guards email and stays in front
+        self.assertEqual(optimized.attributes['code'].names, ('bail', 'string', 'in', 'email'))
+
+        for code in ['x@example.com', 'a', 5, None]:
+            self.assertEqual(
+                Validator({'code': code}, optimized).is_valid(),
+                Validator({'code': code}, schema).is_valid(),
+            )
+
+    def test_failure_in_is_valid_is_recorded(self):
+        statistics = RuleStatistics()
+        Validator({'name': 'jo'}, {'name': 'string|min:3|max:5'}, statistics=statistics).is_valid()
+
+        self.assertEqual(statistics.failure_rate('name', 'min'), 1.0)
+        self.assertIsNone(statistics.failure_rate('name', 'max'))
+
+
+if __name__ == '__main__':
+    unittest.main()
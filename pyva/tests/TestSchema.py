@@ -0,0 +1,124 @@
+import unittest
+from pyva import Schema, Validator
+from pyva.schema import schema_cache
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_validate_many_payloads(self):
+        schema = Schema({
+            'name': 'required|string|min:3',
+            'age': 'required|integer|min:18',
+        })
+
+        self.assertTrue(schema.validate({'name': 'John', 'age': 25}).passes())
+
+        result = schema.validate({'name': 'Jo', 'age': 12})
+        self.assertTrue(result.fails())
+        self.assertTrue('name' in result.failed_rules)
+        self.assertTrue('age' in result.failed_rules)
+
+        self.assertTrue(schema.validate({'name': 'David', 'age': 40}).passes())
+
+    def test_rules_are_parsed_once(self):
+        schema = Schema({
+            'name': 'required|min:3',
+            'tags': ['list', ['max', 5]],
+        })
+
+        name = schema.attributes['name']
+        self.assertEqual(('required', 'min'), name.names)
+        self.assertEqual((3,), name.rules[1].params)
+        self.assertTrue(name.rules[0].implicit)
+        self.assertEqual((5,), schema.attributes['tags'].rules[1].params)
+
+    def test_wildcard_dependent_params(self):
+        schema = Schema({
+            'users.*.name': 'required_with:users.*.age',
+        })
+
+        rule = schema.attributes['users.*.name'].rules[0]
+        self.assertTrue(rule.wildcard_params)
+
+        result = schema.validate({'users': [{'name': 'John', 'age': 20}, {'age': 30}]})
+        self.assertTrue(result.fails())
+        self.assertEqual(['users.1.name'], list(result.failed_rules.keys()))
+
+    def test_validated(self):
+        schema = Schema({
+            'user.name': 'required',
+        })
+
+        self.assertEqual({'user': {'name': 'John'}}, schema.validate({'user': {'name': 'John', 'age': 20}}).validated())
+
+    def test_validator_accepts_schema(self):
+        schema = Schema({'name': 'required'}, {'name.required': 'name is required'})
+
+        v = Validator({}, schema)
+        self.assertTrue(v.fails())
+        self.assertEqual({'name': ['name is required']}, v.failed_rules)
+
+    def test_validator_reuses_cached_schema(self):
+        schema_cache.clear()
+        rules = {'name': 'required|min:3'}
+
+        first = Validator({'name': 'John'}, rules)
+        second = Validator({'name': 'Jo'}, rules)
+
+        self.assertIs(first.schema, second.schema)
+        self.assertEqual(1, schema_cache.misses)
+        self.assertEqual(1, schema_cache.hits)
+        self.assertTrue(first.passes())
+        self.assertTrue(second.fails())
+
+    def test_cache_sees_mutated_rules(self):
+        schema_cache.clear()
+        rules = {'name': 'required|min:3'}
+        self.assertTrue(Validator({'name': 'John'}, rules).passes())
+
+        rules['name'] = 'required|min:5'
+        self.assertTrue(Validator({'name': 'John'}, rules).fails())
+
+        rules['age'] = ['required', ['min', 18]]
+        self.assertTrue(Validator({'name': 'Johnny', 'age': 25}, rules).passes())
+        rules['age'][1][1] = 30
+        v = Validator({'name': 'Johnny', 'age': 25}, rules)
+        self.assertTrue(v.fails())
+        self.assertEqual(['validation.min'], v.failed_rules['age'])
+        self.assertEqual(0, schema_cache.hits)
+
+    def test_cache_key_includes_messages(self):
+        schema_cache.clear()
+        rules = {'name': 'required'}
+
+        first = Validator({}, rules, {'name': 'first message'})
+        second = Validator({}, rules, {'name': 'second message'})
+        first.passes()
+        second.passes()
+
+        self.assertEqual(['first message'], first.failed_rules['name'])
+        self.assertEqual(['second message'], second.failed_rules['name'])
+
+    def test_changed_messages_stay_in_validator(self):
+        schema_cache.clear()
+        first = Validator({}, {'name': 'required'})
+        first.messages['name.required'] = 'custom for first only'
+        first.initial_rules['age'] = 'required'
+        first.passes()
+
+        second = Validator({}, {'name': 'required'})
+        second.passes()
+        self.assertEqual({'name': ['custom for first only']}, first.failed_rules)
+        self.assertEqual({'name': ['validation.required']}, second.failed_rules)
+        self.assertEqual({'name': 'required'}, second.initial_rules)
+
+    def test_cache_clear(self):
+        Validator({}, {'name': 'required'}).passes()
+        schema_cache.clear()
+
+        self.assertEqual(0, len(schema_cache))
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'maxsize': schema_cache.maxsize, 'size': 0}, schema_cache.info())
+
+
+if __name__ == '__main__':
+    unittest.main()
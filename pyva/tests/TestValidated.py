@@ -0,0 +1,90 @@
+import copy
+import unittest
+import pyva.helpers as helpers
+from pyva import Validator, ValidationException
+
+
+def old_validated(data, rules):
+    # validated() before the result was assembled from shared values
+    result = {}
+    for attribute in Validator(data, rules).rules:
+        present, value = helpers.data_lookup(attribute, data)
+        if present:
+            helpers.data_set(result, attribute, value)
+    return result
+
+
+class TestValidated(unittest.TestCase):
+
+    def assertSameValidated(self, data, rules):
+        original = copy.deepcopy(data)
+        expected = old_validated(data, rules)
+        self.assertEqual(Validator(data, rules).validated(), expected)
+        self.assertEqual(Validator(data, rules).validated(copy=False), expected)
+        self.assertEqual(data, original)
+
+    def test_copy(self):
+        data = {'user': {'name': 'John', 'tags': ['a']}, 'age': 20}
+        rules = {'user': 'required|dict', 'user.name': 'required', 'user.tags.*': 'string'}
+
+        copied = Validator(data, rules).validated()
+        self.assertEqual(copied, {'user': {'name': 'John', 'tags': ['a']}})
+        self.assertIsNot(copied['user'], data['user'])
+        self.assertIsNot(copied['user']['tags'], data['user']['tags'])
+
+        shared = Validator(data, rules).validated(copy=False)
+        self.assertEqual(shared, copied)
+        self.assertIs(shared['user'], data['user'])
+
+    def test_nested_values_are_shared(self):
+        data = {'users': [{'name': 'John', 'age': 20}, {'name': 'Anna'}]}
+        shared = Validator(data, {'users.*.name': 'required', 'users.*.age': 'nullable'}).validated(copy=False)
+        self.assertEqual(shared, {'users': [{'name': 'John', 'age': 20}, {'name': 'Anna'}]})
+        self.assertIsNot(shared['users'], data['users'])
+        self.assertIs(shared['users'][0]['name'], data['users'][0]['name'])
+
+    def test_same_as_before(self):
+        self.assertSameValidated(
+            {'user': {'name': 'John', 'age': 20}, 'items': [{'id': 1}, {'id': 2, 'x': 3}]},
+            {'items.*.id': 'required', 'user.name': 'required', 'user': 'dict', 'items': 'list', 'missing': 'nullable'}
+        )
+        # key with dot is taken as a whole and written as path, into the copy of user
+        self.assertSameValidated({'user': {'name': 'John'}, 'user.name': 'Anna'}, {'user': 'dict', 'user.name': 'string'})
+        # -1 of data and -1 of the result are different items
+        self.assertSameValidated({'a': [{}, [None]]}, {'a.0': 'nullable', 'a.-1.0': 'nullable'})
+        self.assertSameValidated({'a': [1, 2, 3]}, {'a.2': 'integer', 'a': 'list', 'a.-1': 'integer'})
+
+    def test_lazy(self):
+        data = {'users': [{'name': 'John', 'age': 20}, {'name': 'Anna'}]}
+        rules = {'users': 'list', 'users.*.name': 'required'}
+        v = Validator(data, rules, lazy=True)
+        self.assertEqual(v.validated(copy=False), old_validated(data, rules))
+
+    def test_items(self):
+        data = {'users': [{'name': 'John', 'age': 20}, {'name': 'Anna'}], 'total': 2}
+        rules = {'total': 'integer', 'users.*.age': 'nullable|integer', 'users.*.name': 'required', 'x': 'nullable'}
+        expected = [('total', 2), ('users.0.age', 20), ('users.0.name', 'John'), ('users.1.name', 'Anna')]
+        self.assertEqual(list(Validator(data, rules).validated_items()), expected)
+        self.assertEqual(list(Validator(data, rules, lazy=True).validated_items()), expected)
+
+        result = {}
+        for attribute, value in Validator(data, rules).validated_items():
+            helpers.data_set(result, attribute, value)
+        self.assertEqual(result, Validator(data, rules).validated())
+
+    def test_lazy_items_are_expanded_while_iterating(self):
+        data = {'rows': [{'id': i} for i in range(100)]}
+        v = Validator(data, {'rows.*.id': 'required|integer'}, lazy=True)
+        items = v.validated_items()
+        for index, (attribute, value) in enumerate(items):
+            self.assertEqual((attribute, value), ('rows.{}.id'.format(index), index))
+            self.assertEqual(list(v._paths), [attribute])
+        self.assertEqual(v._paths, {})
+
+    def test_items_of_failed_validation(self):
+        with self.assertRaises(ValidationException):
+            Validator({'name': None}, {'name': 'required'}).validated_items()
+
+
+if __name__ == '__main__':
+    unittest.main()
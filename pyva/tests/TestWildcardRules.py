@@ -0,0 +1,129 @@
+import unittest
+from pyva import Schema, Validator
+
+
+class TestWildcardRules(unittest.TestCase):
+
+    def test_expand(self):
+        compiled = Schema({'users.*.family.*.child': 'required'}).attributes['users.*.family.*.child']
+        data = {
+            'users': [
+                {'family': [{'child': 'a'}, {'child': 'b'}]},
+                {'family': {'son': {'child': 'c'}}},
+            ]
+        }
+
+        self.assertEqual([
+            ('users.0.family.0.child', ('users', 0, 'family', 0, 'child'), ('0', '0')),
+            ('users.0.family.1.child', ('users', 0, 'family', 1, 'child'), ('0', '1')),
+            ('users.1.family.son.child', ('users', 1, 'family', 'son', 'child'), ('1', 'son')),
+        ], list(compiled.expand(data)))
+
+    def test_expand_missing_data(self):
+        compiled = Schema({'users.*.family.*.child': 'required'}).attributes['users.*.family.*.child']
+
+        self.assertEqual([('users.0.family.0.child', ('users', 0, 'family', 0, 'child'), ('0', '0'))],
+                         list(compiled.expand({})))
+        self.assertEqual([
+            ('users.0.family.0.child', ('users', 0, 'family', 0, 'child'), ('0', '0')),
+            ('users.1.family.0.child', ('users', 1, 'family', 0, 'child'), ('1', '0')),
+        ], list(compiled.expand({'users': [{'family': []}, {}]})))
+
+    def test_expand_trailing_wildcard(self):
+        compiled = Schema({'tags.*': 'string'}).attributes['tags.*']
+
+        self.assertEqual([('tags.0', ('tags', 0), ('0',)), ('tags.1', ('tags', 1), ('1',))],
+                         list(compiled.expand({'tags': ['a', 'b']})))
+
+    def test_expanded_attributes_keep_keys(self):
+        v = Validator({
+            'users': [{'name': 'John'}, {'name': 'Anna'}],
+        }, {
+            'users': 'required|list',
+            'users.*.name': 'required|string',
+        })
+
+        self.assertEqual(['users', 'users.0.name', 'users.1.name'], list(v.rules.keys()))
+        self.assertEqual({'users.0.name': ('0',), 'users.1.name': ('1',)}, v._implicit_attributes['users.*.name'])
+
+    def test_dependent_rule_keys(self):
+        v = Validator({
+            'users': [
+                {'name': 'John', 'family': [{'age': 30, 'child': 5}, {'age': 3, 'child': 1}]},
+            ],
+        }, {
+            'users.*.family.*.child': 'required_with:users.*.name|lt:users.*.family.*.age',
+        })
+
+        self.assertEqual(['0', '1'], v._attribute_keys('users.0.family.1.child'))
+        self.assertEqual([], v._attribute_keys('users'))
+        self.assertTrue(v.passes())
+
+        v = Validator({'items': [{'x': 1, 'y': 2}, {'x': 5, 'y': 2}]}, {'items.*.y': 'gt:items.*.x'})
+        self.assertTrue(v.fails())
+        self.assertEqual(['items.1.y'], list(v.failed_rules.keys()))
+
+    def test_dependent_rule_key_with_asterisk(self):
+        rules = {'groups.*.members.*.code': 'required_with:groups.*.members.*.name'}
+        v = Validator({'groups': {'a*b': {'members': {'x': {'name': 'John'}}}}}, rules)
+
+        self.assertEqual(['groups.a*b.members.x.name'], v._replace_asterisks(['groups.*.members.*.name'], ['a*b', 'x']))
+        self.assertTrue(v.fails())
+        self.assertEqual({'groups.a*b.members.x.code': ['validation.required_with']}, v.failed_rules)
+
+    def test_large_list(self):
+        data = {'users': [{'name': 'user {}'.format(i), 'children': [{'age': 5}]} for i in range(20000)]}
+        data['users'][15000]['children'][0]['age'] = 'five'
+
+        v = Validator(data, {
+            'users.*.name': 'required|string',
+            'users.*.children.*.age': 'required|integer',
+        })
+
+        self.assertTrue(v.fails())
+        self.assertEqual(['users.15000.children.0.age'], list(v.failed_rules.keys()))
+
+    def test_lazy(self):
+        data = {
+            'users': [
+                {'name': 'John', 'age': 20, 'family': [{'child': 'a'}, {'child': ''}]},
+                {'name': 'Jo', 'age': 30},
+            ]
+        }
+        rules = {
+            'users': 'required|list',
+            'users.*.name': 'required|min:3',
+            'users.*.age': 'required_with:users.*.name|gt:users.0.age',
+            'users.*.family.*.child': 'required',
+        }
+
+        eager = Validator(data, rules)
+        lazy = Validator(data, rules, lazy=True)
+
+        self.assertTrue(eager.fails())
+        self.assertTrue(lazy.fails())
+        self.assertEqual(eager.failed_rules, lazy.failed_rules)
+        self.assertEqual(['users'], list(lazy.rules.keys()))
+        self.assertEqual(['users'], list(lazy._paths.keys()))
+        self.assertEqual({}, lazy._wildcard_keys)
+
+    def test_lazy_validated(self):
+        schema = Schema({'users.*.name': 'required|string'})
+        data = {'users': [{'name': 'John', 'age': 20}, {'name': 'Anna'}]}
+
+        self.assertEqual({'users': [{'name': 'John'}, {'name': 'Anna'}]}, schema.validate(data, lazy=True).validated())
+
+    def test_lazy_has_rule(self):
+        found = []
+
+        def check(attribute, value, fail):
+            found.append(v.has_rule(attribute, 'string'))
+
+        v = Validator({'tags': ['a', 'b']}, {'tags.*': ['string', check]}, lazy=True)
+
+        self.assertTrue(v.passes())
+        self.assertEqual([True, True], found)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,99 +1,177 @@
 import pyva.helpers as helpers
+import pyva.regexes as regexes
 from pyva.closureValidationRule import ClosureValidationRule
-from pyva import ValidationException
-import random
-import string
-from pyva import RuleContract
-import re
+from pyva import ValidationException, AsyncRuleContract
+from pyva.schema import Schema, to_numeric_params
+from pyva.parallel import validate_parallel
+from pyva.lruCache import LRUCache
+import pyva.codegen as codegen
+from collections import namedtuple
+from copy import deepcopy
+import asyncio
+import inspect
+import time
+
+RecordResult = namedtuple('RecordResult', ['index', 'passed', 'errors'])
+
+# results of pure rules shared by all validators, disabled until maxsize is set, see Validator._memoized()
+result_cache = LRUCache(maxsize=0)
+
+
+class _FirstFailure(Exception):
+    '''
+    raised by is_valid() validation at the first failed rule
+    '''
 
 
 class Validator:
-    _implicit_rules = [
-        'required',
-        'required_with',
-        'required_with_all',
-        'required_without',
-        'required_without_all',
-        'required_if',
-        'required_unless',
-        'present',
-    ]
-
-    _dependent_rules = [
-        'required_with', 'required_with_all', 'required_without', 'required_without_all',
-        'required_if', 'required_unless', 'confirmed', 'same', 'different', 'unique',
-        'before', 'after', 'before_or_equal', 'after_or_equal', 'gt', 'lt', 'gte', 'lte',
-    ]
+    _implicit_rules = Schema._implicit_rules
 
-    _size_rules = ['size', 'between', 'min', 'max', 'gt', 'lt', 'gte', 'lte']
+    _dependent_rules = Schema._dependent_rules
 
-    _compiled_regexes = None
+    _size_rules = ['size', 'between', 'min', 'max', 'gt', 'lt', 'gte', 'lte']
 
     _numeric_rules = ['numeric', 'integer']
 
-    _regex_rules = ['re']
+    _regex_rules = Schema._regex_rules
+
+    # rules which result depends only on the value and params, they are memoized in result_cache
+    _pure_rules = ['email', 'url', 'ip', 'ipv4', 'ipv6', 're', 'date']
+
+    _lazy_resolved_size = 1024
+
+    # dependent rules and if all their params (True) or only the first one (False) are other fields
+    _referencing_rules = {
+        'required_with': True, 'required_with_all': True, 'required_without': True, 'required_without_all': True,
+        'required_if': False, 'required_unless': False, 'gt': False, 'gte': False, 'lt': False, 'lte': False,
+    }
 
     __passed = None
 
-    def __init__(self, data, rules, messages=None):
+    def __init__(self, data, rules, messages=None, lazy=False, stop_on_first_failure=False, statistics=None,
+                 hooks=None):
+        self.schema = rules if isinstance(rules, Schema) else Schema.cached(rules, messages)
+        # the schema can be shared by the whole process through Schema.cached(), changes stay in this validator
+        self.initial_rules = self.schema.initial_rules.copy()
+        self.messages = self.schema.messages.copy()
+        self.lazy = lazy
+        self.stop_on_first_failure = stop_on_first_failure
+        self.statistics = statistics
+        # ValidationHook instances called around every rule, RuleStatistics is one of them
+        self.hooks = list(hooks) if hooks else []
+        if statistics is not None:
+            self.hooks.append(statistics)
+        self._boolean_only = False
+        self._checks = codegen.checks(self.schema, self.__class__) if self.schema.codegen else None
+        self._reset(data)
+
+    def _reset(self, data):
+        '''
+        prepare validator for new data, parsed rules are kept
+        '''
         self.data = data
-        self.initial_rules = rules.copy()
-        self.messages = {} if messages is None else messages
+        self.__passed = None
+        self._async_checks = None
         self._failed_rules = {}
         self._implicit_attributes = {}
-        self.rules = self.explode_rules(rules)
-
-    def explode_rules(self, rules: dict):
-        rule_copy = rules.copy()
-        for attribute, rule in rule_copy.items():
-            # split rules into list
-            split_rule = rule.split('|') if isinstance(rule, str) else rule
-            rule_copy[attribute] = split_rule
+        self._wildcard_keys = {}
+        self._paths = {}
+        self._lazy_rules = {}
+        # other fields referenced by dependent rules, attribute -> (present, value)
+        self._resolved = {}
+        self._resolved_hits = 0
+        self._resolved_misses = 0
+        # built by _dependency_graph() on the first revalidate()
+        self._dependents = None
+        self.rules = self.explode_rules(self.schema.attributes)
+
+    @classmethod
+    def validate_many(cls, records, rules, messages=None, lazy=False, iterator=False, parallel=None, chunk_size=1000,
+                      hooks=None):
+        '''
+        validate every record with the same rules, rules are parsed once for the whole batch
+
+        results = Validator.validate_many(records, rules)
+        failed = [result for result in results if not result.passed]
+
+        :param records: iterable of data to validate
+        :param rules: rules dict or Schema
+        :param messages:
+        :param lazy: see Validator lazy mode
+        :param iterator: return generator instead of list
+        :param parallel: number of worker processes (True for cpu count), rules must be picklable
+        :param chunk_size: number of records sent to worker process at once
+        :param hooks: ValidationHook instances, not supported in worker processes
+        :return: list of RecordResult(index, passed, errors), errors are None for passed records
+        '''
+        schema = rules if isinstance(rules, Schema) else Schema.cached(rules, messages)
+        if parallel is True or (parallel and parallel > 1):
+            if hooks:
+                raise ValueError('Hooks can not collect results of worker processes, use parallel=None with hooks')
+            results = validate_parallel(records, schema, cls, lazy, parallel, chunk_size)
+        else:
+            results = cls._validate_records(records, schema, lazy, hooks)
+        return results if iterator else list(results)
+
+    @classmethod
+    def _validate_records(cls, records, schema, lazy, hooks=None):
+        validator = None
+        for index, record in enumerate(records):
+            if validator is None:
+                validator = cls(record, schema, lazy=lazy, hooks=hooks)
+            else:
+                validator._reset(record)
+
+            if validator.passes():
+                yield RecordResult(index, True, None)
+            else:
+                yield RecordResult(index, False, validator.failed_rules)
+
+    def explode_rules(self, rules):
+        exploded = dict(rules)
+        for attribute, compiled in rules.items():
+            exploded[attribute] = compiled
+            if compiled.path is not None:
+                self._paths[attribute] = compiled.path
+            # lazy validator expands wildcard rules while validating, see _concrete_rules()
+            if compiled.is_wildcard and self.lazy:
+                self._lazy_rules[attribute] = compiled
+                del exploded[attribute]
             # if there is * then we are gone iterate over data and create all nested rules
-            if '*' in attribute:
-                nested_attributes = self._extract_wildcard_rules(attribute, split_rule)
-                if attribute not in self._implicit_attributes:
-                    self._implicit_attributes[attribute] = []
-                self._implicit_attributes[attribute] = list(nested_attributes.keys())
-                rule_copy = {**rule_copy, **nested_attributes}
-                del rule_copy[attribute]
-        return rule_copy
+            elif compiled.is_wildcard:
+                expanded = self._implicit_attributes[attribute] = {}
+                for nested_attribute, path, keys in compiled.expand(self.data):
+                    expanded[nested_attribute] = keys
+                    self._wildcard_keys[nested_attribute] = (attribute, keys)
+                    exploded[nested_attribute] = compiled
+                    self._paths[nested_attribute] = path
+                del exploded[attribute]
+        return exploded
+
+    def _concrete_rules(self):
+        '''
+        yield (attribute, compiled) for every attribute to validate.
+        Wildcard rules of lazy validator are expanded from the data on the fly, path and keys of
+        such attribute are kept only while it is processed, so nothing is stored per list item
+
+        :return: generator
+        '''
+        yield from self.rules.items()
+
+        for pattern, compiled in self._lazy_rules.items():
+            for attribute, path, keys in compiled.expand(self.data):
+                self._paths[attribute] = path
+                self._wildcard_keys[attribute] = (pattern, keys)
+                try:
+                    yield attribute, compiled
+                finally:
+                    self._paths.pop(attribute, None)
+                    self._wildcard_keys.pop(attribute, None)
 
     def __require_parameter_count(self, count, params, rule):
         if len(params) < count:
             raise ValueError("Validation rule {} requires at least {} parameters.".format(rule, count))
 
-    def _extract_wildcard_rules(self, attribute, rule):
-        '''
-
-        recursively extract nested attributes
-
-        :param attribute:
-        :param rule:
-        :param data:
-        :return:
-        '''
-        wildcard_rules = {}
-        # users.*.family.*.child
-        # extract data for first * and do it recursively
-        attr_list = attribute.split('*', maxsplit=1)
-
-        attr = attr_list.pop(0).strip('.')
-        nested_rules = attr_list[0]
-        extracted_data = helpers.data_get(attr, self.data)
-
-        if not extracted_data:
-            wildcard_rules[attribute.replace('*', '0')] = rule
-            return wildcard_rules
-
-        for key, value in helpers.foreach(extracted_data):
-            if '*' in nested_rules:
-                wildcard_rules = {**wildcard_rules,
-                                  **self._extract_wildcard_rules(attr + '.' + str(key) + nested_rules, rule)}
-            else:
-                wildcard_rules[attr + '.' + str(key) + nested_rules] = rule
-        return wildcard_rules
-
     def _get_size(self, attribute, value):
         if helpers.is_numeric(value):
             return helpers.to_numeric(value)
@@ -115,7 +193,7 @@ class Validator:
     def _validate_required_if(self, attribute, value, *other_params):
         self.__require_parameter_count(2, other_params, 'required_if')
 
-        other_value = helpers.data_get(other_params[0], self.data)
+        other_value = self._other_value(other_params[0])
         values = other_params[1:]
 
         if isinstance(other_value, bool):
@@ -128,7 +206,7 @@ class Validator:
 
     def _validate_required_unless(self, attribute, value, *other_params):
         self.__require_parameter_count(2, other_params, 'required_unless')
-        other_value = helpers.data_get(other_params[0], self.data)
+        other_value = self._other_value(other_params[0])
         values = other_params[1:]
 
         if isinstance(other_value, bool):
@@ -141,7 +219,7 @@ class Validator:
         return True
 
     def _validate_present(self, attribute, value, *other_params):
-        return helpers.data_has(attribute, self.data)
+        return self._lookup(attribute)[0]
 
     def _validate_required_with(self, attribute, value, *other_fields):
         if self._any_required(other_fields):
@@ -165,19 +243,19 @@ class Validator:
 
     def _any_failing_required(self, params):
         for att in params:
-            if not self._validate_required(att, helpers.data_get(att, self.data)):
+            if not self._validate_required(att, self._other_value(att)):
                 return True
         return False
 
     def _all_failing_required(self, params):
         for att in params:
-            if self._validate_required(att, helpers.data_get(att, self.data)):
+            if self._validate_required(att, self._other_value(att)):
                 return False
         return True
 
     def _any_required(self, params):
         for att in params:
-            if self._validate_required(att, helpers.data_get(att, self.data)):
+            if self._validate_required(att, self._other_value(att)):
                 return True
         return False
 
@@ -201,7 +279,7 @@ class Validator:
 
     def _validate_gt(self, attribute, value, *other_filed):
         self.__require_parameter_count(1, other_filed, 'gt')
-        other_value = helpers.data_get(other_filed[0], self.data)
+        other_value = self._other_value(other_filed[0])
 
         # if values are numeric cast and check
         if helpers.is_numeric(value) and helpers.is_numeric(other_value):
@@ -218,7 +296,7 @@ class Validator:
 
     def _validate_gte(self, attribute, value, *other_filed):
         self.__require_parameter_count(1, other_filed, 'gte')
-        other_value = helpers.data_get(other_filed[0], self.data)
+        other_value = self._other_value(other_filed[0])
 
         # if values are numeric cast and check
         if helpers.is_numeric(value) and helpers.is_numeric(other_value):
@@ -235,7 +313,7 @@ class Validator:
 
     def _validate_lt(self, attribute, value, *other_filed):
         self.__require_parameter_count(1, other_filed, 'lt')
-        other_value = helpers.data_get(other_filed[0], self.data)
+        other_value = self._other_value(other_filed[0])
 
         # if values are numeric cast and check
         if helpers.is_numeric(value) and helpers.is_numeric(other_value):
@@ -252,7 +330,7 @@ class Validator:
 
     def _validate_lte(self, attribute, value, *other_filed):
         self.__require_parameter_count(1, other_filed, 'lte')
-        other_value = helpers.data_get(other_filed[0], self.data)
+        other_value = self._other_value(other_filed[0])
 
         # if values are numeric cast and check
         if helpers.is_numeric(value) and helpers.is_numeric(other_value):
@@ -279,40 +357,22 @@ class Validator:
     def _validate_dict(self, attribute, value):
         return isinstance(value, dict)
 
-    def __compile_regex(self, pattern):
-        if self._compiled_regexes is None:
-            self._compiled_regexes = {}
-        if pattern not in self._compiled_regexes:
-            self._compiled_regexes[pattern] = re.compile(pattern)
-
     def _validate_email(self, attribute, value):
-        pattern = """^(?!(?:(?:\\x22?\\x5C[\\x00-\\x7E]\\x22?)|(?:\\x22?[^\\x5C\\x22]\\x22?)){255,})(?!(?:(?:\\x22?\\x5C[\\x00-\\x7E]\\x22?)|(?:\\x22?[^\\x5C\\x22]\\x22?)){65,}@)(?:(?:[\\x21\\x23-\\x27\\x2A\\x2B\\x2D\\x2F-\\x39\\x3D\\x3F\\x5E-\\x7E]+)|(?:\\x22(?:[\\x01-\\x08\\x0B\\x0C\\x0E-\\x1F\\x21\\x23-\\x5B\\x5D-\\x7F]|(?:\\x5C[\\x00-\\x7F]))*\\x22))(?:\\.(?:(?:[\\x21\\x23-\\x27\\x2A\\x2B\\x2D\\x2F-\\x39\\x3D\\x3F\\x5E-\\x7E]+)|(?:\\x22(?:[\\x01-\\x08\\x0B\\x0C\\x0E-\\x1F\\x21\\x23-\\x5B\\x5D-\\x7F]|(?:\\x5C[\\x00-\\x7F]))*\\x22)))*@(?:(?:(?!.*[^.]{64,})(?:(?:(?:xn--)?[a-z0-9]+(?:-[a-z0-9]+)*\\.){1,126}){1,}(?:(?:[a-z][a-z0-9]*)|(?:(?:xn--)[a-z0-9]+))(?:-[a-z0-9]+)*)|(?:\\[(?:(?:IPv6:(?:(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){7})|(?:(?!(?:.*[a-f0-9][:\\]]){7,})(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){0,5})?::(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){0,5})?)))|(?:(?:IPv6:(?:(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){5}:)|(?:(?!(?:.*[a-f0-9]:){5,})(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){0,3})?::(?:[a-f0-9]{1,4}(?::[a-f0-9]{1,4}){0,3}:)?)))?(?:(?:25[0-5])|(?:2[0-4][0-9])|(?:1[0-9]{2})|(?:[1-9]?[0-9]))(?:\\.(?:(?:25[0-5])|(?:2[0-4][0-9])|(?:1[0-9]{2})|(?:[1-9]?[0-9]))){3}))\\]))$"""
-        self.__compile_regex(pattern)
-        return self._compiled_regexes[pattern].search(value) is not None
+        if not regexes.plausible_email(value):
+            return False
+        return regexes.builtin('email').search(value) is not None
 
     def _validate_url(self, attribute, value):
-        pattern = """^(https?|ftp)://(-\.)?([^\s/?\.#-]+\.?)+(/[^\s]*)?$"""
-        self.__compile_regex(pattern)
-
-        return self._compiled_regexes[pattern].search(value) is not None
+        return regexes.builtin('url').search(value) is not None
 
     def _validate_ip(self, attribute, value):
-        pattern = """((^\s*((([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))\s*$)|(^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*$))"""
-        self.__compile_regex(pattern)
-
-        return self._compiled_regexes[pattern].search(value) is not None
+        return regexes.builtin('ip').search(value) is not None
 
     def _validate_ipv4(self, attribute, value):
-        pattern = """^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$"""
-        self.__compile_regex(pattern)
-
-        return self._compiled_regexes[pattern].search(value) is not None
+        return regexes.builtin('ipv4').search(value) is not None
 
     def _validate_ipv6(self, attribute, value):
-        pattern = """^(([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$"""
-        self.__compile_regex(pattern)
-
-        return self._compiled_regexes[pattern].search(value) is not None
+        return regexes.builtin('ipv6').search(value) is not None
 
     def _validate_in(self, attribute, value, *other_values):
         return value in other_values
@@ -323,90 +383,163 @@ class Validator:
     def _validate_nullable(self, *empty_params):
         return True
 
+    def _validate_bail(self, *empty_params):
+        return True
+
     def _validate_re(self, attribute, value, *re):
-        self.__compile_regex(re[0])
-        return self._compiled_regexes[re[0]].search(value) is not None
+        return regexes.user_pattern(re[0]).search(value) is not None
 
     def _validate_date(self, attribute, value, *other):
         return helpers.is_date(value)
 
     def get_value(self, attribute):
-        return helpers.data_get(attribute, self.data)
+        return self._lookup(attribute)[1]
 
-    def __validate_attribute(self, attribute, rule):
-        self._current_rule = rule
-        value = self.get_value(attribute)
+    def _lookup(self, attribute):
+        return helpers.data_lookup(attribute, self.data, self._paths.get(attribute))
 
-        if callable(rule):
-            callback = ClosureValidationRule(rule)
-            if not callback.passes(attribute, value):
-                self._add_message(attribute, message=callback.message)
-            return
-
-        if isinstance(rule, RuleContract):
-            return self._validate_with_custom_rule(rule, attribute, value)
+    def _other_value(self, attribute):
+        '''
+        value of other field referenced by dependent rule, every field is resolved once per validation
 
-        rule_suffix, params = self._parse_rules(rule)
+        :param attribute:
+        :return: value or None when the field is missing
+        '''
+        resolved = self._resolved.get(attribute)
+        if resolved is not None:
+            self._resolved_hits += 1
+            return resolved[1]
+
+        self._resolved_misses += 1
+        if self.lazy and len(self._resolved) >= self._lazy_resolved_size:
+            # fields of expanded attributes are not kept for the whole list in lazy mode
+            self._resolved.clear()
+        resolved = self._resolved[attribute] = self._lookup(attribute)
+        return resolved[1]
+
+    def resolution_info(self):
+        '''
+        how many times other fields referenced by dependent rules were taken from the per validation memo
 
-        if rule_suffix in self._dependent_rules:
+        :return: dict
+        '''
+        return {
+            'hits': self._resolved_hits,
+            'misses': self._resolved_misses,
+            'size': len(self._resolved),
+        }
+
+    def __validate_attribute(self, attribute, rule, value):
+        self._current_rule = rule.rule
+
+        if rule.custom:
+            if callable(rule.rule):
+                callback = ClosureValidationRule(rule.rule)
+                if not callback.passes(attribute, value):
+                    self._add_message(attribute, message=callback.message)
+                return
+
+            return self._validate_with_custom_rule(rule.rule, attribute, value)
+
+        params = rule.params
+        if rule.wildcard_params:
             keys = self._attribute_keys(attribute)
             if keys:
                 params = self._replace_asterisks(params, keys)
+            params = self._to_numeric_if_needs(params)
 
-        params = self._to_numeric_if_needs(params)
+        method = getattr(self, '_validate_' + rule.name)
+        if not self.is_validatable(attribute, rule.name, value):
+            return
 
-        validatable = self.is_validatable(attribute, rule_suffix, value)
+        if result_cache.maxsize > 0 and rule.name in self._pure_rules:
+            passed = self._memoized((self.__class__, rule.name, tuple(params)), method, attribute, value, params)
+        else:
+            passed = method(attribute, value, *params)
+
+        if not passed:
+            self._add_message(attribute, rule.name)
 
-        method = getattr(self, '_validate_' + rule_suffix)
-        if validatable and not method(attribute, value, *params):
-            self._add_message(attribute, rule_suffix)
+    def _memoized(self, key, check, attribute, value, params=()):
+        '''
+        result of the check from result_cache, the check is called only on a cache miss.
+        Value type is part of the key, so 1, 1.0 and True are cached separately,
+        unhashable values are always checked
+
+        :param key: rule part of the cache key
+        :param check: callable(attribute, value, *params)
+        :param attribute:
+        :param value:
+        :param params:
+        :return: bool
+        '''
+        try:
+            key = key + (type(value), value)
+            passed = result_cache.get(key)
+        except TypeError:
+            return check(attribute, value, *params)
+
+        if passed is None:
+            passed = bool(check(attribute, value, *params))
+            result_cache.put(key, passed)
+        return passed
 
     def _to_numeric_if_needs(self, params):
-        return list(map(lambda val: helpers.to_numeric(val) if helpers.is_numeric(val) else val, params))
+        return to_numeric_params(params)
 
     def _attribute_keys(self, attribute: str):
-        original_attribute = attribute
-        for unparsed, parsed in helpers.foreach(self._implicit_attributes):
-            if attribute in parsed:
-                original_attribute = unparsed
-
-        pattern = re.escape(original_attribute).replace('\*', '([^\.]+)')
-        searches = re.findall(pattern, attribute, re.DOTALL)
+        '''
+        keys that replaced * in the pattern of expanded attribute, users.5.name -> ['5']
 
-        if searches:
-            if isinstance(searches[0], tuple):
-                searches = list(searches[0])
-        return searches
+        :param attribute:
+        :return: list
+        '''
+        if attribute not in self._wildcard_keys:
+            return []
+        return list(self._wildcard_keys[attribute][1])
 
     def _replace_asterisks(self, params, keys):
         parsed_params = []
         for attr in params:
-            attr = attr.replace('*', '{}')
-            parsed_params.append(attr.format(*keys))
+            # one pass, so * inside of a key is not replaced by the next key
+            parts = attr.split('*')
+            replaced = [parts[0]]
+            for index, part in enumerate(parts[1:]):
+                replaced.append(keys[index] if index < len(keys) else '*')
+                replaced.append(part)
+            parsed_params.append(''.join(replaced))
         return parsed_params
 
     def _validate_with_custom_rule(self, rule, attribute, value):
-        if not rule.passes(attribute, value):
+        if isinstance(rule, AsyncRuleContract):
+            if self._async_checks is None:
+                raise ValueError('{} is async rule, use passes_async() to validate'.format(rule.__class__.__name__))
+            # checked later by passes_async() together with all other async rules
+            self._async_checks.append((rule, attribute, value))
+            return
+
+        if rule.pure and result_cache.maxsize > 0:
+            passed = self._memoized((rule,), rule.passes, attribute, value)
+        else:
+            passed = rule.passes(attribute, value)
+
+        if not passed:
+            if self._boolean_only:
+                raise _FirstFailure
             if helpers.method_exists(rule, 'message'):
                 self._add_message(attribute, message=rule.message(attribute, value))
             else:
                 self._add_message(attribute, rule.__class__.__name__)
 
     def is_validatable(self, attribute, rule, value):
-        if rule in self._implicit_rules:
-            return True
-
-        data = helpers.data_get(attribute, self.data)
-
-        if self.has_rule(attribute, 'nullable') == False and data is not None:
-            return True
-
-        if helpers.data_has(attribute, self.data) and data is not None:
-            return True
-
-        return False
+        # value is resolved from the data, so None here means the attribute is missing or null,
+        # only implicit rules are applied to such values
+        return rule in self._implicit_rules or value is not None
 
     def _add_message(self, attribute, rule_suffix=None, message=None):
+        if self._boolean_only:
+            raise _FirstFailure
+
         if attribute not in self._failed_rules:
             self._failed_rules[attribute] = []
 
@@ -424,33 +557,16 @@ class Validator:
 
     def _get_rule(self, attribute):
 
-        if attribute not in self.rules:
-            return []
-
-        rules = []
-        for rule in self.rules[attribute]:
-            if callable(rule) or isinstance(rule, RuleContract):
-                rules.append(rule)
-            else:
-                rule_suffix, params = self._parse_rules(rule)
-                rules.append(rule_suffix)
-
-        return rules
-
-    def _parse_rules(self, rules: str):
-
-        if isinstance(rules, list):
-            return [rules[0], rules[1:]]
+        if attribute in self.rules:
+            return list(self.rules[attribute].names)
 
-        parsed = rules.split(':', 1)
-        rule = parsed.pop(0)
-        if len(parsed) == 0:
-            return [rule, []]
+        if attribute in self._wildcard_keys and self._wildcard_keys[attribute][0] in self._lazy_rules:
+            return list(self._lazy_rules[self._wildcard_keys[attribute][0]].names)
 
-        if rule in self._regex_rules:
-            return [rule, parsed]
+        return []
 
-        return [rule, parsed[0].split(',')]
+    def _parse_rules(self, rules):
+        return self.schema.split_rule(rules)
 
     def _should_stop(self, attribute):
         '''
@@ -471,28 +587,368 @@ class Validator:
         if self.__passed is not None:
             return self.__passed
 
-        for attribute, rules in self.rules.items():
-            for rule in rules:
-                self.__validate_attribute(attribute, rule)
+        self._validate_attributes()
+
+        self.__passed = len(self._failed_rules) == 0
+        return self.__passed
+
+    async def passes_async(self, concurrency=10):
+        '''
+        same as passes(), but AsyncRuleContract rules are awaited concurrently,
+        messages of failed async rules are added after all other rules are checked
+
+        :param concurrency: maximum number of async rules awaited at the same time, None for no limit
+        :return: bool
+        '''
+        if self.__passed is not None:
+            return self.__passed
+
+        self._async_checks = []
+        try:
+            self._validate_attributes()
+            checks = self._async_checks
+        finally:
+            self._async_checks = None
+
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def check(rule, attribute, value):
+            if semaphore is None:
+                return await rule.passes(attribute, value)
+            async with semaphore:
+                return await rule.passes(attribute, value)
+
+        results = await asyncio.gather(*(check(*args) for args in checks))
+
+        for (rule, attribute, value), passed in zip(checks, results):
+            if passed:
+                continue
+            if helpers.method_exists(rule, 'message'):
+                message = rule.message(attribute, value)
+                if inspect.isawaitable(message):
+                    message = await message
+                self._add_message(attribute, message=message)
+            else:
+                self._add_message(attribute, rule.__class__.__name__)
+
+        self.__passed = len(self._failed_rules) == 0
+        return self.__passed
+
+    def is_valid(self):
+        '''
+        check only if data is valid, validation stops at the first failed rule and no error messages are built
+
+        :return: bool
+        '''
+        if self.__passed is not None:
+            return self.__passed
+
+        self._boolean_only = True
+        try:
+            self._validate_attributes()
+        except _FirstFailure:
+            return False
+        finally:
+            self._boolean_only = False
+
+        self.__passed = True
+        return True
 
-                if self._should_stop(attribute):
-                    break
+    def _validate_attributes(self):
+        for attribute, compiled in self._concrete_rules():
+            if self._validate_rules(attribute, compiled):
+                return
+
+    def _validate_rules(self, attribute, compiled):
+        '''
+        run rules of one attribute
+
+        :return: True when the whole validation must stop
+        '''
+        value = self.get_value(attribute)
+        if self._checks is not None and not self.hooks:
+            return self._checks[compiled.attribute](
+                self, attribute, value, self._failed_rules, self.stop_on_first_failure, compiled.rules
+            )
+
+        for rule in compiled.rules:
+            if self.hooks:
+                self._validate_with_hooks(attribute, rule, value)
+            else:
+                self.__validate_attribute(attribute, rule, value)
+
+            if self.stop_on_first_failure and self._failed_rules:
+                return True
+
+            if self._should_stop(attribute) or (compiled.bail and attribute in self._failed_rules):
+                break
+        return False
+
+    def update(self, path, value):
+        '''
+        set value in data and validate again only attributes affected by the change, see revalidate()
+
+        v.update('users.3.email', 'john@example.com')
+
+        :param path:
+        :param value:
+        :return: bool
+        '''
+        changed = self._created_path(path)
+        helpers.data_set(self.data, path, value)
+        return self.revalidate([changed])
+
+    def _created_path(self, path):
+        '''
+        data_set() creates missing dicts and pads lists on the way to the path,
+        so the change starts at the first missing key or at the list which gets new items
+
+        :param path:
+        :return: str
+        '''
+        parts = path.split('.')
+        parent = self.data
+        for index in range(len(parts)):
+            present, value = helpers.resolve_path(helpers.compile_path(parts[index]), parent)
+            if not present:
+                if isinstance(parent, list) and index > 0:
+                    return '.'.join(parts[:index])
+                return '.'.join(parts[:index + 1])
+            parent = value
+        return path
+
+    def revalidate(self, paths):
+        '''
+        validate again after data of paths was changed. Only attributes of the paths, attributes under and
+        above them and attributes which reference them in required_*, gt, gte, lt and lte rules are validated,
+        wildcard rules are expanded again when the change adds or removes list items. failed_rules is updated in place.
+
+        Custom rules which read other fields of data are not tracked
+
+        :param paths: changed paths like users.0.email
+        :return: bool
+        '''
+        if self.lazy:
+            raise ValueError('Lazy validator does not keep expanded attributes, validate data again instead')
+
+        if self.__passed is None:
+            return self.passes()
+
+        self._resolved.clear()
+        if self.stop_on_first_failure:
+            # the first failure depends on the order of all attributes
+            self._failed_rules.clear()
+            self._validate_attributes()
+        else:
+            affected = self._expand_again(paths)
+            for path in paths:
+                affected.update(self._affected_attributes(path))
+
+            for attribute, compiled in self.rules.items():
+                if attribute in affected:
+                    self._failed_rules.pop(attribute, None)
+                    self._validate_rules(attribute, compiled)
+
+            # keep the order errors have after full validation
+            failed = [
+                (attribute, self._failed_rules[attribute]) for attribute in self.rules if attribute in self._failed_rules
+            ]
+            self._failed_rules.clear()
+            self._failed_rules.update(failed)
 
         self.__passed = len(self._failed_rules) == 0
         return self.__passed
 
-    def validated(self):
+    def _expand_again(self, paths):
+        '''
+        expand wildcard rules again when any path changes lists or dicts iterated by them
+
+        :return: attributes of expanded again rules, before and after the change
+        '''
+        patterns = [
+            pattern for pattern, compiled in self.schema.attributes.items()
+            if compiled.is_wildcard and any(_changes_expansion(pattern, path) for path in paths)
+        ]
+        if not patterns:
+            return set()
+
+        # old attributes are validated again too, the same attribute can have rules of other pattern now
+        affected = {attribute for pattern in patterns for attribute in self._implicit_attributes[pattern]}
+        for attribute in affected:
+            self._failed_rules.pop(attribute, None)
+
+        self._implicit_attributes = {}
+        self._wildcard_keys = {}
+        self._paths = {}
+        self._dependents = None
+        self.rules = self.explode_rules(self.schema.attributes)
+
+        affected.update(attribute for pattern in patterns for attribute in self._implicit_attributes[pattern])
+        return affected
+
+    def _affected_attributes(self, path):
+        affected = {attribute for attribute in self.rules if _related_paths(attribute, path)}
+        for reference, attributes in self._dependency_graph().items():
+            if _related_paths(reference, path):
+                affected.update(attributes)
+        return affected
+
+    def _dependency_graph(self):
+        '''
+        other field -> attributes which reference it in dependent rules, * in params is already replaced
+
+        :return: dict
+        '''
+        if self._dependents is not None:
+            return self._dependents
+
+        graph = self._dependents = {}
+        for attribute, compiled in self.rules.items():
+            for rule in compiled.rules:
+                if rule.custom or rule.name not in self._referencing_rules:
+                    continue
+
+                params = rule.params
+                if rule.wildcard_params:
+                    keys = self._attribute_keys(attribute)
+                    if keys:
+                        params = self._replace_asterisks(params, keys)
+
+                references = params if self._referencing_rules[rule.name] else params[:1]
+                for reference in references:
+                    graph.setdefault(str(reference), set()).add(attribute)
+        return graph
+
+    def _validate_with_hooks(self, attribute, rule, value):
+        '''
+        validate attribute and call hooks before and after the rule, expanded attribute is reported with its pattern
+        '''
+        pattern = self._wildcard_keys[attribute][0] if attribute in self._wildcard_keys else attribute
+        name = rule.rule if rule.custom else rule.name
+        for hook in self.hooks:
+            hook.before_rule(self, attribute, pattern, name)
+
+        failures = len(self._failed_rules.get(attribute, ()))
+        passed = False
+        start = time.perf_counter()
+        try:
+            self.__validate_attribute(attribute, rule, value)
+            passed = len(self._failed_rules.get(attribute, ())) == failures
+        finally:
+            elapsed = time.perf_counter() - start
+            for hook in self.hooks:
+                hook.after_rule(self, attribute, pattern, name, passed, elapsed)
+
+    def validated(self, copy=True):
+        '''
+        data of attributes which have rules, paths compiled for the validation are reused.
+        Value which is already inside of written one (user and user.name) is not written again
+
+        :param copy: deep copy the result, with False values are shared with data and must not be changed
+        :return: dict
+        '''
         if self.fails():
             raise ValidationException(self)
 
         result = {}
-        for attribute, rules in self.rules.items():
-            missing_data = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(15))
-            value = helpers.data_get(attribute, self.data, missing_data)
+        created = {id(result): result}
+        for attribute, compiled in self._concrete_rules():
+            present, value = self._lookup(attribute)
+            if not present:
+                continue
+
+            path = self._paths.get(attribute) or helpers.compile_path(attribute)
+            if not self._set_validated(result, path, value, created):
+                # attribute like user.name is a key of data itself, it must not be set into shared user
+                return self._validated_copies()
+
+        return deepcopy(result) if copy else result
+
+    @staticmethod
+    def _set_validated(result, path, value, created):
+        '''
+        set value at path the same way as helpers.path_set(), but only dicts and lists created for the result
+        are changed. Values of data in the result are shared, inside them the value must be already there
+
+        :param created: id -> container created for the result
+        :return: False when the value can not be set without copying
+        '''
+        container = result
+        last = len(path) - 1
+        for position, segment in enumerate(path):
+            if id(container) not in created:
+                present, parent = helpers.resolve_path(path[position:last], container)
+                try:
+                    return present and type(parent) in (dict, list) and parent[path[last]] is value
+                except (KeyError, IndexError, TypeError):
+                    return False
+
+            if position == last:
+                helpers.array_set(container, segment, value)
+                return True
+
+            if type(segment) is int:
+                missing = not helpers.has_key(segment, container) and isinstance(container, list)
+            else:
+                missing = segment not in container
+            if missing:
+                child = [] if type(path[position + 1]) is int else {}
+                created[id(child)] = child
+                helpers.array_set(container, segment, child)
+            container = container[segment]
+
+    def validated_items(self):
+        '''
+        (attribute, value) of every validated attribute present in data, in the order of rules.
+        Values are shared with data, wildcard rules of lazy validator are expanded while iterating,
+        so nothing is stored per list item
 
-            if value != missing_data:
+        for attribute, value in Validator(data, rules, lazy=True).validated_items():
+            writer.write(attribute, value)
+
+        :return: generator
+        '''
+        if self.fails():
+            raise ValidationException(self)
+        return self._validated_items()
+
+    def _validated_items(self):
+        for attribute, compiled in self._concrete_rules():
+            present, value = self._lookup(attribute)
+            if present:
+                yield attribute, value
+
+    def _validated_copies(self):
+        result = {}
+        for attribute, compiled in self._concrete_rules():
+            present, value = self._lookup(attribute)
+            if present:
                 helpers.data_set(result, attribute, value)
         return result
 
     def fails(self):
         return not self.passes()
+
+
+def _related_paths(first, second):
+    '''
+    True when paths are the same or one of them is inside the other, user and user.name are related
+    '''
+    return first == second or first.startswith(second + '.') or second.startswith(first + '.')
+
+
+def _changes_expansion(pattern, path):
+    '''
+    True when changed path can add or remove items iterated by * of the pattern,
+    for users.*.family.* these are users, users.N, users.N.family and users.N.family.N
+    '''
+    pattern_parts = pattern.split('.')
+    path_parts = path.split('.')
+    for index, part in enumerate(pattern_parts):
+        if part != '*':
+            continue
+        if len(path_parts) <= index + 1 and all(
+            expected in ('*', actual) for expected, actual in zip(pattern_parts, path_parts)
+        ):
+            return True
+    return False
@@ -1,3 +1,4 @@
+import re
 from setuptools import setup, find_packages
 
 # read the contents of your README file
@@ -6,10 +7,14 @@ this_directory = path.abspath(path.dirname(__file__))
 with open(path.join(this_directory, 'README.md'), encoding='utf-8') as f:
     long_description = f.read()
 
+# version is defined only in pyva/__init__.py, the package is not imported before it is installed
+with open(path.join(this_directory, 'pyva', '__init__.py'), encoding='utf-8') as f:
+    version = re.search(r"^__version__ = '([^']+)'", f.read(), re.M).group(1)
+
 setup(
     name='pyva',
     packages=find_packages(),
-    version='0.4.1',
+    version=version,
     license='MIT',
     description='Simple and flexible python data validation library',
     long_description=long_description,
@@ -21,6 +26,9 @@ setup(
     install_requires=[  # I get to this in a second
         'python-dateutil',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',